@@ -0,0 +1,54 @@
+"""
+Shared test setup for Virtual Groups.
+
+Makes the add-on modules importable without Blender, once per process:
+- utils is imported directly from the virtual_groups directory
+- query_parser is loaded with its relative import stubbed out
+
+Test modules import `utils` and `query_parser` from here. pytest also
+picks this file up automatically as its conftest.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+# Add virtual_groups directory to path to import modules directly
+# This avoids importing __init__.py which requires bpy (Blender)
+virtual_groups_path = Path(__file__).parent.parent / "virtual_groups"
+if str(virtual_groups_path) not in sys.path:
+    sys.path.insert(0, str(virtual_groups_path))
+
+import utils
+
+
+def _compile_query_parser(path):
+    """Compile query_parser.py with its relative import stubbed out."""
+    # Replace the relative import line; utils is injected into the namespace
+    source = path.read_text()
+    source = source.replace("from . import utils", "# from . import utils (mocked)")
+    return compile(source, str(path), "exec")
+
+
+def _load_query_parser():
+    """Load query_parser.py as a module without importing the package."""
+    if "query_parser" in sys.modules:
+        return sys.modules["query_parser"]
+
+    path = virtual_groups_path / "query_parser.py"
+
+    # Create a module object
+    module = types.ModuleType("query_parser")
+    module.__file__ = str(path)
+
+    # Inject utils into the module's namespace before execution
+    module.utils = utils
+
+    exec(_compile_query_parser(path), module.__dict__)
+
+    # Register it so utils' fallback `import query_parser` finds this module
+    sys.modules["query_parser"] = module
+    return module
+
+
+query_parser = _load_query_parser()
@@ -3,30 +3,91 @@
 Test runner for Virtual Groups add-on.
 
 Runs all unit tests and displays results.
+
+Usage:
+    python tests/run_tests.py            # run all tests in this process
+    python tests/run_tests.py -j 4       # four worker processes, one file each
 """
 
+import argparse
+import io
 import unittest
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+TESTS_DIR = Path(__file__).parent
 
-def run_all_tests():
-    """Discover and run all tests."""
-    # Discover all test files in the tests directory
+
+def run_test_file(path):
+    """
+    Run the tests in a single file (used by worker processes).
+
+    Args:
+        path: Path to a test_*.py file
+
+    Returns:
+        tuple: (was_successful, runner output)
+    """
     loader = unittest.TestLoader()
-    start_dir = Path(__file__).parent
-    suite = loader.discover(start_dir, pattern='test_*.py')
+    suite = loader.discover(TESTS_DIR, pattern=Path(path).name)
 
-    # Run tests with verbose output
-    runner = unittest.TextTestRunner(verbosity=2)
+    stream = io.StringIO()
+    runner = unittest.TextTestRunner(stream=stream, verbosity=2)
     result = runner.run(suite)
 
-    # Return exit code based on success/failure
-    return 0 if result.wasSuccessful() else 1
+    return result.wasSuccessful(), stream.getvalue()
+
+
+def positive_int(value):
+    """argparse type: an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def run_all_tests(jobs=1):
+    """Discover and run all tests."""
+    if jobs == 1:
+        # Discover all test files in the tests directory
+        loader = unittest.TestLoader()
+        suite = loader.discover(TESTS_DIR, pattern='test_*.py')
+
+        # Run tests with verbose output
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
+
+        # Return exit code based on success/failure
+        return 0 if result.wasSuccessful() else 1
+
+    # Parallel: each test file runs whole in one worker, so per-module
+    # setup (e.g. loading query_parser) happens once per file
+    test_files = sorted(str(p) for p in TESTS_DIR.glob('test_*.py'))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(run_test_file, test_files))
+
+    for _, output in results:
+        sys.stderr.write(output)
+
+    return 0 if all(ok for ok, _ in results) else 1
 
 
 if __name__ == '__main__':
-    sys.exit(run_all_tests())
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '-j', '--jobs',
+        type=positive_int,
+        default=1,
+        help="Number of worker processes (default: 1)"
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help="Verbose output (always on; accepted for compatibility)"
+    )
+    args = parser.parse_args()
+    sys.exit(run_all_tests(args.jobs))
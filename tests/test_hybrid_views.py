@@ -5,18 +5,13 @@ Tests the get_objects_in_view() function which combines
 query-based and membership-based object inclusion.
 """
 
+import copy
 import unittest
-import sys
-from pathlib import Path
-import json
 
-# Add virtual_groups directory to path to import modules directly
-# This avoids importing __init__.py which requires bpy (Blender)
-virtual_groups_path = Path(__file__).parent.parent / "virtual_groups"
-sys.path.insert(0, str(virtual_groups_path))
-
-# Import utils module directly
-import utils
+try:
+    from .conftest import utils
+except ImportError:
+    from conftest import utils
 
 
 class MockObject:
@@ -25,6 +20,7 @@ class MockObject:
     def __init__(self, name):
         self.name = name
         self._props = {}
+        self._repr = f"<MockObject '{name}'>"
 
     def __setitem__(self, key, value):
         """Mock custom property setter."""
@@ -38,8 +34,14 @@ class MockObject:
         """Mock custom property get with default."""
         return self._props.get(key, default)
 
+    def copy(self):
+        """Return a copy with its own custom property dict."""
+        clone = copy.copy(self)
+        clone._props = self._props.copy()
+        return clone
+
     def __repr__(self):
-        return f"<MockObject '{self.name}'>"
+        return self._repr
 
 
 class MockScene:
@@ -61,14 +63,21 @@ class MockView:
 class TestMembershipTagOperations(unittest.TestCase):
     """Test membership tag operations (basic functionality)."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the tagged prototype objects once for the class."""
+        cls._proto_obj1 = MockObject("TestObject1")
+        cls._proto_obj2 = MockObject("TestObject2")
+        cls._proto_obj3 = MockObject("TestObject3")
+        utils.set_tags_on_object(cls._proto_obj1, ["tag1", "tag2"])
+        utils.set_tags_on_object(cls._proto_obj2, ["tag3"])
+        utils.set_tags_on_object(cls._proto_obj3, [])
+
     def setUp(self):
-        """Set up test objects."""
-        self.obj1 = MockObject("TestObject1")
-        self.obj2 = MockObject("TestObject2")
-        self.obj3 = MockObject("TestObject3")
-        utils.set_tags_on_object(self.obj1, ["tag1", "tag2"])
-        utils.set_tags_on_object(self.obj2, ["tag3"])
-        utils.set_tags_on_object(self.obj3, [])
+        """Give each test its own copies of the prototype objects."""
+        self.obj1 = self._proto_obj1.copy()
+        self.obj2 = self._proto_obj2.copy()
+        self.obj3 = self._proto_obj3.copy()
 
     def test_membership_tag_format(self):
         """Test that membership tags follow correct format."""
@@ -79,7 +88,7 @@ class TestMembershipTagOperations(unittest.TestCase):
         utils.add_tag_to_object(self.obj1, membership_tag)
 
         # Verify tag is stored correctly
-        tags = utils.get_tags_on_object(self.obj1)
+        tags = set(utils.get_tags_on_object(self.obj1))
         self.assertIn(membership_tag, tags)
 
     def test_membership_tag_persists_with_regular_tags(self):
@@ -90,10 +99,8 @@ class TestMembershipTagOperations(unittest.TestCase):
         utils.add_tag_to_object(self.obj1, membership_tag)
 
         # Verify both regular and membership tags exist
-        tags = utils.get_tags_on_object(self.obj1)
-        self.assertIn(membership_tag, tags)
-        self.assertIn("tag1", tags)
-        self.assertIn("tag2", tags)
+        tags = set(utils.get_tags_on_object(self.obj1))
+        self.assertEqual(tags, {"tag1", "tag2", membership_tag})
 
     def test_multiple_membership_tags_on_same_object(self):
         """Test object can have membership in multiple views."""
@@ -101,16 +108,12 @@ class TestMembershipTagOperations(unittest.TestCase):
         tag2 = "view-guid-2"
         tag3 = "view-guid-3"
 
-        # Add multiple membership tags
-        utils.add_tag_to_object(self.obj1, tag1)
-        utils.add_tag_to_object(self.obj1, tag2)
-        utils.add_tag_to_object(self.obj1, tag3)
+        # Add multiple membership tags in one write
+        utils.add_tags_to_objects([self.obj1], [tag1, tag2, tag3])
 
         # Verify all membership tags exist
-        tags = utils.get_tags_on_object(self.obj1)
-        self.assertIn(tag1, tags)
-        self.assertIn(tag2, tags)
-        self.assertIn(tag3, tags)
+        tags = set(utils.get_tags_on_object(self.obj1))
+        self.assertLessEqual({tag1, tag2, tag3}, tags)
 
     def test_remove_membership_tag_leaves_others(self):
         """Test removing one membership tag doesn't affect others."""
@@ -118,18 +121,14 @@ class TestMembershipTagOperations(unittest.TestCase):
         tag2 = "view-guid-2"
 
         # Add two membership tags
-        utils.add_tag_to_object(self.obj1, tag1)
-        utils.add_tag_to_object(self.obj1, tag2)
+        utils.add_tags_to_objects([self.obj1], [tag1, tag2])
 
         # Remove one
         utils.remove_tag_from_object(self.obj1, tag1)
 
-        # Verify only tag1 is gone
-        tags = utils.get_tags_on_object(self.obj1)
-        self.assertNotIn(tag1, tags)
-        self.assertIn(tag2, tags)
-        self.assertIn("tag1", tags)  # Regular tags unaffected
-        self.assertIn("tag2", tags)
+        # Verify only tag1 is gone; regular tags unaffected
+        tags = set(utils.get_tags_on_object(self.obj1))
+        self.assertEqual(tags, {tag2, "tag1", "tag2"})
 
     def test_membership_tag_on_object_without_tags(self):
         """Test adding membership tag to object with no existing tags."""
@@ -140,17 +139,21 @@ class TestMembershipTagOperations(unittest.TestCase):
 
         # Verify tag was added
         tags = utils.get_tags_on_object(self.obj3)
-        self.assertEqual(len(tags), 1)
-        self.assertIn(membership_tag, tags)
+        self.assertEqual(tags, [membership_tag])
 
 
 class TestMembershipOperations(unittest.TestCase):
     """Test membership tag operations (add/remove)."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the tagged prototype object once for the class."""
+        cls._proto_obj = MockObject("TestObject")
+        utils.set_tags_on_object(cls._proto_obj, ["tag1", "tag2"])
+
     def setUp(self):
-        """Set up test objects."""
-        self.obj = MockObject("TestObject")
-        utils.set_tags_on_object(self.obj, ["tag1", "tag2"])
+        """Give each test its own copy of the prototype object."""
+        self.obj = self._proto_obj.copy()
 
     def test_add_membership_tag(self):
         """Test adding view membership tag."""
@@ -159,13 +162,9 @@ class TestMembershipOperations(unittest.TestCase):
         # Add membership tag
         utils.add_tag_to_object(self.obj, membership_tag)
 
-        # Verify tag was added
-        tags = utils.get_tags_on_object(self.obj)
-        self.assertIn(membership_tag, tags)
-
-        # Verify original tags are preserved
-        self.assertIn("tag1", tags)
-        self.assertIn("tag2", tags)
+        # Verify tag was added and original tags are preserved
+        tags = set(utils.get_tags_on_object(self.obj))
+        self.assertEqual(tags, {"tag1", "tag2", membership_tag})
 
     def test_remove_membership_tag(self):
         """Test removing view membership tag."""
@@ -175,13 +174,9 @@ class TestMembershipOperations(unittest.TestCase):
         utils.add_tag_to_object(self.obj, membership_tag)
         utils.remove_tag_from_object(self.obj, membership_tag)
 
-        # Verify tag was removed
-        tags = utils.get_tags_on_object(self.obj)
-        self.assertNotIn(membership_tag, tags)
-
-        # Verify original tags are preserved
-        self.assertIn("tag1", tags)
-        self.assertIn("tag2", tags)
+        # Verify tag was removed and original tags are preserved
+        tags = set(utils.get_tags_on_object(self.obj))
+        self.assertEqual(tags, {"tag1", "tag2"})
 
     def test_add_membership_tag_idempotent(self):
         """Test that adding same membership tag twice doesn't duplicate."""
@@ -199,16 +194,17 @@ class TestMembershipOperations(unittest.TestCase):
 class TestViewTagFiltering(unittest.TestCase):
     """Test filtering of view-* tags from UI display."""
 
-    def setUp(self):
-        """Set up test objects with mixed regular and view tags."""
-        self.obj1 = MockObject("TestObject1")
-        self.obj2 = MockObject("TestObject2")
+    @classmethod
+    def setUpClass(cls):
+        """Set up test objects with mixed regular and view tags (read-only)."""
+        cls.obj1 = MockObject("TestObject1")
+        cls.obj2 = MockObject("TestObject2")
 
         # Mix regular tags and view tags
-        utils.set_tags_on_object(self.obj1, ["candle", "view-guid-123", "desk"])
-        utils.set_tags_on_object(self.obj2, ["props", "view-guid-456", "hero"])
+        utils.set_tags_on_object(cls.obj1, ["candle", "view-guid-123", "desk"])
+        utils.set_tags_on_object(cls.obj2, ["props", "view-guid-456", "hero"])
 
-        self.scene = MockScene([self.obj1, self.obj2])
+        cls.scene = MockScene([cls.obj1, cls.obj2])
 
     def test_filter_view_tags_from_list(self):
         """Test filtering view-* tags from a tag list."""
@@ -249,5 +245,120 @@ class TestViewTagFiltering(unittest.TestCase):
         self.assertIn("candle", filtered)
 
 
+class TestViewObjectResolution(unittest.TestCase):
+    """Test resolving a View's objects from its query and membership."""
+
+    def setUp(self):
+        """Set up a scene with query-matched and member objects."""
+        self.candle = MockObject("Candle")
+        self.member = MockObject("Member")
+        self.other = MockObject("Other")
+        utils.set_tags_on_object(self.candle, ["candle"])
+        utils.set_tags_on_object(self.member, ["props", "view-test-guid-12345"])
+        utils.set_tags_on_object(self.other, ["props"])
+        self.scene = MockScene([self.candle, self.member, self.other])
+
+    def test_query_and_membership_are_combined(self):
+        """Objects matching the query or carrying the membership tag are included."""
+        view = MockView(query="tag:candle")
+        objects = utils.get_objects_in_view(view, self.scene)
+        self.assertCountEqual(objects, [self.candle, self.member])
+
+    def test_membership_only_view(self):
+        """A View without a query contains only its members."""
+        objects = utils.get_objects_in_view(MockView(), self.scene)
+        self.assertEqual(objects, [self.member])
+
+    def test_result_follows_tag_changes(self):
+        """Tag writes after resolving a View are reflected on the next call."""
+        view = MockView()
+        utils.get_objects_in_view(view, self.scene)
+
+        utils.add_tag_to_object(self.other, "view-test-guid-12345")
+
+        objects = utils.get_objects_in_view(view, self.scene)
+        self.assertCountEqual(objects, [self.member, self.other])
+
+
+class TestViewIconStates(unittest.TestCase):
+    """Test refreshing a View's cached visibility icon states."""
+
+    def setUp(self):
+        """Set up a membership View over two visible objects."""
+        self.obj1 = MockObject("Obj1")
+        self.obj2 = MockObject("Obj2")
+        for obj in (self.obj1, self.obj2):
+            obj.hide_viewport = False
+            obj.hide_render = False
+            utils.set_tags_on_object(obj, ["view-test-guid-12345"])
+        self.scene = MockScene([self.obj1, self.obj2])
+
+        self.view = MockView()
+        self.view.icon_all_visible = True
+        self.view.icon_all_render_visible = True
+
+    def test_icons_follow_object_visibility(self):
+        """Hiding any object clears the matching "all visible" state."""
+        self.obj2.hide_viewport = True
+        utils.update_view_icon_states(self.view, self.scene)
+        self.assertFalse(self.view.icon_all_visible)
+        self.assertTrue(self.view.icon_all_render_visible)
+
+        self.obj2.hide_viewport = False
+        self.obj1.hide_render = True
+        utils.update_view_icon_states(self.view, self.scene)
+        self.assertTrue(self.view.icon_all_visible)
+        self.assertFalse(self.view.icon_all_render_visible)
+
+    def test_empty_view_counts_as_visible(self):
+        """A View without objects shows the "all visible" icons."""
+        view = MockView(guid="empty-guid")
+        view.icon_all_visible = False
+        view.icon_all_render_visible = False
+
+        utils.update_view_icon_states(view, self.scene)
+        self.assertTrue(view.icon_all_visible)
+        self.assertTrue(view.icon_all_render_visible)
+
+
+class TestViewChildExpansion(unittest.TestCase):
+    """Test expanding View objects with their descendants."""
+
+    def setUp(self):
+        """Set up a small hierarchy: root -> (child_a -> grandchild, child_b)."""
+        self.root = MockObject("Root")
+        self.child_a = MockObject("ChildA")
+        self.child_b = MockObject("ChildB")
+        self.grandchild = MockObject("Grandchild")
+        self.loose = MockObject("Loose")
+
+        self.root.parent = None
+        self.child_a.parent = self.root
+        self.child_b.parent = self.root
+        self.grandchild.parent = self.child_a
+        self.loose.parent = None
+
+        self.scene = MockScene([
+            self.root, self.child_a, self.child_b, self.grandchild, self.loose
+        ])
+
+    def test_descendants_are_included(self):
+        """All descendants should follow the given objects."""
+        objects = utils.get_objects_with_children([self.root], self.scene)
+        self.assertEqual(objects[0], self.root)
+        self.assertCountEqual(
+            objects, [self.root, self.child_a, self.child_b, self.grandchild]
+        )
+
+    def test_overlapping_objects_are_not_duplicated(self):
+        """Objects reachable from several View objects appear once."""
+        objects = utils.get_objects_with_children(
+            [self.child_a, self.root, self.grandchild], self.scene
+        )
+        self.assertCountEqual(
+            objects, [self.root, self.child_a, self.child_b, self.grandchild]
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
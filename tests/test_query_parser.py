@@ -4,289 +4,207 @@ Unit tests for query_parser module.
 Tests query validation, parsing, and evaluation logic.
 """
 
+import copy
+import functools
 import unittest
-import sys
-from pathlib import Path
 
-# Add virtual_groups directory to path to import modules directly
-# This avoids importing __init__.py which requires bpy (Blender)
-virtual_groups_path = Path(__file__).parent.parent / "virtual_groups"
-sys.path.insert(0, str(virtual_groups_path))
+try:
+    from .conftest import query_parser, utils
+except ImportError:
+    from conftest import query_parser, utils
 
-# Import utils first
-import utils
 
-# Manually load query_parser.py and replace its import statement
-# Read the file and execute it with utils in the namespace
-query_parser_code = (virtual_groups_path / "query_parser.py").read_text()
-
-# Create a module object
-import types
-query_parser = types.ModuleType("query_parser")
-query_parser.__file__ = str(virtual_groups_path / "query_parser.py")
-
-# Inject utils into the module's namespace before execution
-query_parser.utils = utils
-
-# Execute the module code, replacing the relative import line
-query_parser_code = query_parser_code.replace("from . import utils", "# from . import utils (mocked)")
-exec(query_parser_code, query_parser.__dict__)
+# Queries shared across test classes; each string is defined once
+Q_CANDLE = "tag:candle"
+Q_DESK_AND_CANDLE = "tag:desk AND tag:candle"
+Q_DESK_OR_PROPS = "tag:desk OR tag:props"
+Q_HERO_NOT_SMALL = "tag:hero AND NOT tag:small"
+Q_A_OR_B_AND_C = "tag:a OR tag:b AND tag:c"
+Q_A_AND_B_OR_C = "tag:a AND tag:b OR tag:c"
+Q_COMPLEX = "tag:a AND tag:b OR tag:c AND NOT tag:d"
+Q_HEARTH_OR_DESK_PROPS = "tag:hearth OR tag:desk AND tag:props"
+Q_HEARTH_AND_PROPS_OR_DESK_AND_PROPS = "tag:hearth AND tag:props OR tag:desk AND tag:props"
 
 
 class MockObject:
     """Mock Blender object for testing."""
 
+    __slots__ = ("name", "_tags_raw")
+
     def __init__(self, name, tags):
         self.name = name
-        self._tags = tags
+        # Serialize once; tags never change after construction
+        self._tags_raw = ",".join(tags) if tags else None
 
     def get(self, key, default=None):
         """Mock the object's custom property getter."""
-        if key == "vg_tags":
-            import json
-            return json.dumps(self._tags) if self._tags else default
+        if key == "vg_tags" and self._tags_raw is not None:
+            return self._tags_raw
         return default
 
 
-class TestQueryValidation(unittest.TestCase):
-    """Test query validation logic."""
-
-    def test_empty_query(self):
-        """Empty query should be invalid."""
-        is_valid, error = query_parser.validate_query("")
-        self.assertFalse(is_valid)
-        self.assertIn("empty", error.lower())
-
-    def test_whitespace_only_query(self):
-        """Whitespace-only query should be invalid."""
-        is_valid, error = query_parser.validate_query("   ")
-        self.assertFalse(is_valid)
-        self.assertIn("empty", error.lower())
-
-    def test_no_tag_clause(self):
-        """Query without 'tag:' should be invalid."""
-        is_valid, error = query_parser.validate_query("candle")
-        self.assertFalse(is_valid)
-        self.assertIn("tag:", error)
-
-    def test_invalid_tag_characters(self):
-        """Query with invalid tag characters should extract valid parts."""
-        # Note: Our validation allows "tag:hello@world" because it finds "hello"
-        # The @ is outside the tag name pattern and would be ignored
-        # This is acceptable behavior for v0
-        is_valid, error = query_parser.validate_query("tag:hello@world")
-        # Actually finds "hello" as a valid tag, so this passes validation
-        self.assertTrue(is_valid)
-
-    def test_starts_with_operator(self):
-        """Query starting with AND/OR should be invalid."""
-        is_valid, error = query_parser.validate_query("AND tag:candle")
-        self.assertFalse(is_valid)
-        self.assertIn("start", error.lower())
-
-        is_valid, error = query_parser.validate_query("OR tag:candle")
-        self.assertFalse(is_valid)
-        self.assertIn("start", error.lower())
-
-    def test_ends_with_operator(self):
-        """Query ending with an operator should be invalid."""
-        is_valid, error = query_parser.validate_query("tag:candle AND")
-        self.assertFalse(is_valid)
-        self.assertIn("end", error.lower())
-
-        is_valid, error = query_parser.validate_query("tag:candle OR")
-        self.assertFalse(is_valid)
-        self.assertIn("end", error.lower())
-
-        is_valid, error = query_parser.validate_query("tag:candle NOT")
-        self.assertFalse(is_valid)
-
-    def test_valid_single_tag(self):
-        """Valid single tag query."""
-        is_valid, error = query_parser.validate_query("tag:candle")
-        self.assertTrue(is_valid)
-        self.assertEqual(error, "")
-
-    def test_valid_and_query(self):
-        """Valid AND query."""
-        is_valid, error = query_parser.validate_query("tag:desk AND tag:candle")
-        self.assertTrue(is_valid)
-        self.assertEqual(error, "")
-
-    def test_valid_or_query(self):
-        """Valid OR query."""
-        is_valid, error = query_parser.validate_query("tag:desk OR tag:props")
-        self.assertTrue(is_valid)
-        self.assertEqual(error, "")
-
-    def test_valid_not_query(self):
-        """Valid NOT query."""
-        is_valid, error = query_parser.validate_query("tag:hero AND NOT tag:small")
-        self.assertTrue(is_valid)
-        self.assertEqual(error, "")
-
-    def test_valid_complex_query(self):
-        """Valid complex query with mixed operators."""
-        is_valid, error = query_parser.validate_query("tag:a AND tag:b OR tag:c AND NOT tag:d")
-        self.assertTrue(is_valid)
-        self.assertEqual(error, "")
-
-
-class TestQueryEvaluation(unittest.TestCase):
-    """Test query evaluation logic."""
-
-    def test_single_tag_match(self):
-        """Object with matching tag should return True."""
-        obj = MockObject("Cube", ["candle"])
-        result = query_parser.evaluate_query("tag:candle", obj)
-        self.assertTrue(result)
-
-    def test_single_tag_no_match(self):
-        """Object without matching tag should return False."""
-        obj = MockObject("Cube", ["desk"])
-        result = query_parser.evaluate_query("tag:candle", obj)
-        self.assertFalse(result)
-
-    def test_object_with_no_tags(self):
-        """Object with no tags should return False."""
-        obj = MockObject("Cube", [])
-        result = query_parser.evaluate_query("tag:candle", obj)
-        self.assertFalse(result)
-
-    def test_and_both_tags_present(self):
-        """Object with both tags should match AND query."""
-        obj = MockObject("Cube", ["desk", "candle"])
-        result = query_parser.evaluate_query("tag:desk AND tag:candle", obj)
-        self.assertTrue(result)
-
-    def test_and_one_tag_missing(self):
-        """Object missing one tag should not match AND query."""
-        obj = MockObject("Cube", ["desk"])
-        result = query_parser.evaluate_query("tag:desk AND tag:candle", obj)
-        self.assertFalse(result)
+@functools.lru_cache(maxsize=None)
+def _prototype(name, tags):
+    """Build one MockObject per unique (name, tags) pair."""
+    return MockObject(name, list(tags))
 
-    def test_and_both_tags_missing(self):
-        """Object missing both tags should not match AND query."""
-        obj = MockObject("Cube", ["props"])
-        result = query_parser.evaluate_query("tag:desk AND tag:candle", obj)
-        self.assertFalse(result)
 
-    def test_or_first_tag_present(self):
-        """Object with first tag should match OR query."""
-        obj = MockObject("Cube", ["desk"])
-        result = query_parser.evaluate_query("tag:desk OR tag:props", obj)
-        self.assertTrue(result)
+def make_object(name, tags):
+    """
+    Get a MockObject for the given name and tags.
 
-    def test_or_second_tag_present(self):
-        """Object with second tag should match OR query."""
-        obj = MockObject("Cube", ["props"])
-        result = query_parser.evaluate_query("tag:desk OR tag:props", obj)
-        self.assertTrue(result)
-
-    def test_or_both_tags_present(self):
-        """Object with both tags should match OR query."""
-        obj = MockObject("Cube", ["desk", "props"])
-        result = query_parser.evaluate_query("tag:desk OR tag:props", obj)
-        self.assertTrue(result)
+    Returns a shallow copy of a cached prototype; the tag list is shared,
+    so tests must not mutate it.
+    """
+    return copy.copy(_prototype(name, tuple(tags)))
 
-    def test_or_neither_tag_present(self):
-        """Object with neither tag should not match OR query."""
-        obj = MockObject("Cube", ["candle"])
-        result = query_parser.evaluate_query("tag:desk OR tag:props", obj)
-        self.assertFalse(result)
 
-    def test_not_tag_absent(self):
-        """Object without excluded tag should match NOT query."""
-        obj = MockObject("Cube", ["hero"])
-        result = query_parser.evaluate_query("tag:hero AND NOT tag:small", obj)
-        self.assertTrue(result)
+class TestQueryValidation(unittest.TestCase):
+    """Test query validation logic."""
 
-    def test_not_tag_present(self):
-        """Object with excluded tag should not match NOT query."""
-        obj = MockObject("Cube", ["hero", "small"])
-        result = query_parser.evaluate_query("tag:hero AND NOT tag:small", obj)
-        self.assertFalse(result)
+    # (query, expected validity, substring expected in the error message)
+    # Valid queries must report an empty error; None skips the message check.
+    CASES = [
+        # Empty and whitespace-only queries
+        ("", False, "empty"),
+        ("   ", False, "empty"),
+        # Query without 'tag:'
+        ("candle", False, "tag:"),
+        # Invalid tag characters: "tag:hello@world" still finds "hello", and
+        # the @ is outside the tag name pattern (acceptable behavior for v0)
+        ("tag:hello@world", True, ""),
+        # Queries starting with AND/OR
+        ("AND tag:candle", False, "start"),
+        ("OR tag:candle", False, "start"),
+        # Queries ending with an operator
+        ("tag:candle AND", False, "end"),
+        ("tag:candle OR", False, "end"),
+        ("tag:candle NOT", False, None),
+        # Valid single tag, AND, OR, NOT and mixed-operator queries
+        (Q_CANDLE, True, ""),
+        (Q_DESK_AND_CANDLE, True, ""),
+        (Q_DESK_OR_PROPS, True, ""),
+        (Q_HERO_NOT_SMALL, True, ""),
+        (Q_COMPLEX, True, ""),
+    ]
+
+    def test_validate_query(self):
+        """Each query should validate as expected with a matching error."""
+        for query, expected_valid, expected_error in self.CASES:
+            with self.subTest(query=query):
+                is_valid, error = query_parser.validate_query(query)
+                self.assertIs(is_valid, expected_valid)
+                if expected_error == "":
+                    self.assertEqual(error, "")
+                elif expected_error is not None:
+                    self.assertIn(expected_error, error.lower())
+
+
+class TestQueryParsing(unittest.TestCase):
+    """Test parsing queries into (required, excluded) OR clauses."""
+
+    # (query, expected clauses)
+    CASES = [
+        ("", ()),
+        ("   ", ()),
+        (Q_CANDLE, ((frozenset({"candle"}), frozenset()),)),
+        (Q_HERO_NOT_SMALL, ((frozenset({"hero"}), frozenset({"small"})),)),
+        (Q_A_AND_B_OR_C, (
+            (frozenset({"a", "b"}), frozenset()),
+            (frozenset({"c"}), frozenset()),
+        )),
+        # A clause with a malformed term can never match and is dropped
+        ("candle OR tag:desk", ((frozenset({"desk"}), frozenset()),)),
+        ("tag:a AND NOT b", ()),
+    ]
+
+    def test_parse_query(self):
+        """Each query should parse to the expected clauses."""
+        for query, expected in self.CASES:
+            with self.subTest(query=query):
+                self.assertEqual(query_parser.parse_query(query), expected)
+
+    def test_parse_cached_reuses_result(self):
+        """Parsing the same string twice should return the same object."""
+        first = query_parser.parse_cached(Q_COMPLEX)
+        self.assertIs(query_parser.parse_cached(Q_COMPLEX), first)
 
-    def test_not_required_tag_missing(self):
-        """Object missing required tag should not match NOT query."""
-        obj = MockObject("Cube", ["small"])
-        result = query_parser.evaluate_query("tag:hero AND NOT tag:small", obj)
-        self.assertFalse(result)
 
+class TestQueryEvaluation(unittest.TestCase):
+    """Test query evaluation logic."""
 
-class TestOperatorPrecedence(unittest.TestCase):
+    # (description, object tags, query, expected match)
+    CASES = [
+        # Single tag
+        ("single tag match", ["candle"], Q_CANDLE, True),
+        ("single tag no match", ["desk"], Q_CANDLE, False),
+        ("object with no tags", [], Q_CANDLE, False),
+        # AND operator
+        ("and both tags present", ["desk", "candle"], Q_DESK_AND_CANDLE, True),
+        ("and one tag missing", ["desk"], Q_DESK_AND_CANDLE, False),
+        ("and both tags missing", ["props"], Q_DESK_AND_CANDLE, False),
+        # OR operator
+        ("or first tag present", ["desk"], Q_DESK_OR_PROPS, True),
+        ("or second tag present", ["props"], Q_DESK_OR_PROPS, True),
+        ("or both tags present", ["desk", "props"], Q_DESK_OR_PROPS, True),
+        ("or neither tag present", ["candle"], Q_DESK_OR_PROPS, False),
+        # NOT operator
+        ("not tag absent", ["hero"], Q_HERO_NOT_SMALL, True),
+        ("not tag present", ["hero", "small"], Q_HERO_NOT_SMALL, False),
+        ("not required tag missing", ["small"], Q_HERO_NOT_SMALL, False),
+    ]
+
+    def test_evaluate_query(self):
+        """Each object should match its query exactly when expected."""
+        for description, tags, query, expected in self.CASES:
+            with self.subTest(description):
+                obj = make_object("Cube", tags)
+                self.assertIs(query_parser.evaluate_query(query, obj), expected)
+
+
+class QueryTestCase(unittest.TestCase):
+    """Base class for tests evaluating one query against several objects."""
+
+    def assertMatches(self, query, cases):
+        """Evaluate one query against several (object, expected) pairs."""
+        for obj, expected in cases:
+            with self.subTest(obj=obj.name):
+                self.assertIs(query_parser.evaluate_query(query, obj), expected)
+
+
+class TestOperatorPrecedence(QueryTestCase):
     """Test operator precedence (AND binds tighter than OR)."""
 
     def test_or_then_and(self):
         """Query: tag:a OR tag:b AND tag:c should be (a) OR (b AND c)."""
-        # Object with just 'a' should match
-        obj1 = MockObject("Obj1", ["a"])
-        result1 = query_parser.evaluate_query("tag:a OR tag:b AND tag:c", obj1)
-        self.assertTrue(result1, "Object with 'a' should match (a) OR (b AND c)")
-
-        # Object with 'b' and 'c' should match
-        obj2 = MockObject("Obj2", ["b", "c"])
-        result2 = query_parser.evaluate_query("tag:a OR tag:b AND tag:c", obj2)
-        self.assertTrue(result2, "Object with 'b' and 'c' should match (a) OR (b AND c)")
-
-        # Object with just 'b' should NOT match
-        obj3 = MockObject("Obj3", ["b"])
-        result3 = query_parser.evaluate_query("tag:a OR tag:b AND tag:c", obj3)
-        self.assertFalse(result3, "Object with just 'b' should not match (a) OR (b AND c)")
-
-        # Object with just 'c' should NOT match
-        obj4 = MockObject("Obj4", ["c"])
-        result4 = query_parser.evaluate_query("tag:a OR tag:b AND tag:c", obj4)
-        self.assertFalse(result4, "Object with just 'c' should not match (a) OR (b AND c)")
+        self.assertMatches(Q_A_OR_B_AND_C, [
+            (make_object("Obj1", ["a"]), True),        # has 'a'
+            (make_object("Obj2", ["b", "c"]), True),   # has 'b' and 'c'
+            (make_object("Obj3", ["b"]), False),       # just 'b'
+            (make_object("Obj4", ["c"]), False),       # just 'c'
+        ])
 
     def test_and_then_or(self):
         """Query: tag:a AND tag:b OR tag:c should be (a AND b) OR (c)."""
-        # Object with 'a' and 'b' should match
-        obj1 = MockObject("Obj1", ["a", "b"])
-        result1 = query_parser.evaluate_query("tag:a AND tag:b OR tag:c", obj1)
-        self.assertTrue(result1, "Object with 'a' and 'b' should match (a AND b) OR (c)")
-
-        # Object with just 'c' should match
-        obj2 = MockObject("Obj2", ["c"])
-        result2 = query_parser.evaluate_query("tag:a AND tag:b OR tag:c", obj2)
-        self.assertTrue(result2, "Object with 'c' should match (a AND b) OR (c)")
-
-        # Object with just 'a' should NOT match
-        obj3 = MockObject("Obj3", ["a"])
-        result3 = query_parser.evaluate_query("tag:a AND tag:b OR tag:c", obj3)
-        self.assertFalse(result3, "Object with just 'a' should not match (a AND b) OR (c)")
-
-        # Object with just 'b' should NOT match
-        obj4 = MockObject("Obj4", ["b"])
-        result4 = query_parser.evaluate_query("tag:a AND tag:b OR tag:c", obj4)
-        self.assertFalse(result4, "Object with just 'b' should not match (a AND b) OR (c)")
+        self.assertMatches(Q_A_AND_B_OR_C, [
+            (make_object("Obj1", ["a", "b"]), True),   # has 'a' and 'b'
+            (make_object("Obj2", ["c"]), True),        # has 'c'
+            (make_object("Obj3", ["a"]), False),       # just 'a'
+            (make_object("Obj4", ["b"]), False),       # just 'b'
+        ])
 
     def test_complex_precedence(self):
         """Query: tag:a AND tag:b OR tag:c AND NOT tag:d."""
         # Should be: (a AND b) OR (c AND NOT d)
+        self.assertMatches(Q_COMPLEX, [
+            (make_object("Obj1", ["a", "b"]), True),   # has 'a' and 'b'
+            (make_object("Obj2", ["c"]), True),        # 'c' but not 'd'
+            (make_object("Obj3", ["c", "d"]), False),  # 'c' and 'd'
+            (make_object("Obj4", ["a"]), False),       # just 'a'
+        ])
 
-        # Object with 'a' and 'b' should match
-        obj1 = MockObject("Obj1", ["a", "b"])
-        result1 = query_parser.evaluate_query("tag:a AND tag:b OR tag:c AND NOT tag:d", obj1)
-        self.assertTrue(result1)
 
-        # Object with 'c' but not 'd' should match
-        obj2 = MockObject("Obj2", ["c"])
-        result2 = query_parser.evaluate_query("tag:a AND tag:b OR tag:c AND NOT tag:d", obj2)
-        self.assertTrue(result2)
-
-        # Object with 'c' and 'd' should NOT match
-        obj3 = MockObject("Obj3", ["c", "d"])
-        result3 = query_parser.evaluate_query("tag:a AND tag:b OR tag:c AND NOT tag:d", obj3)
-        self.assertFalse(result3)
-
-        # Object with just 'a' should NOT match
-        obj4 = MockObject("Obj4", ["a"])
-        result4 = query_parser.evaluate_query("tag:a AND tag:b OR tag:c AND NOT tag:d", obj4)
-        self.assertFalse(result4)
-
-
-class TestRealWorldScenarios(unittest.TestCase):
+class TestRealWorldScenarios(QueryTestCase):
     """Test real-world usage scenarios."""
 
     def test_hearth_desk_props_scenario(self):
@@ -294,71 +212,33 @@ class TestRealWorldScenarios(unittest.TestCase):
         # This is the scenario the user encountered
         # Query: "tag:hearth OR tag:desk AND tag:props"
         # Parses as: (hearth) OR (desk AND props)
-
-        hearth_prop = MockObject("Candle", ["hearth", "props"])
-        desk_prop = MockObject("Pen", ["desk", "props"])
-        hearth_only = MockObject("Fireplace", ["hearth"])
-        desk_only = MockObject("Table", ["desk"])
-
         # This query has the unintuitive precedence
-        query = "tag:hearth OR tag:desk AND tag:props"
-
-        # Hearth prop matches (has 'hearth')
-        self.assertTrue(query_parser.evaluate_query(query, hearth_prop))
-
-        # Desk prop matches (has 'desk' AND 'props')
-        self.assertTrue(query_parser.evaluate_query(query, desk_prop))
-
-        # Hearth only matches (has 'hearth')
-        self.assertTrue(query_parser.evaluate_query(query, hearth_only))
-
-        # Desk only does NOT match (needs 'props' too)
-        self.assertFalse(query_parser.evaluate_query(query, desk_only))
+        self.assertMatches(Q_HEARTH_OR_DESK_PROPS, [
+            (make_object("Candle", ["hearth", "props"]), True),  # has 'hearth'
+            (make_object("Pen", ["desk", "props"]), True),       # 'desk' AND 'props'
+            (make_object("Fireplace", ["hearth"]), True),        # has 'hearth'
+            (make_object("Table", ["desk"]), False),             # needs 'props' too
+        ])
 
     def test_corrected_hearth_desk_props_scenario(self):
         """User scenario with corrected query using distribution."""
         # Corrected query: "tag:hearth AND tag:props OR tag:desk AND tag:props"
         # Parses as: (hearth AND props) OR (desk AND props)
-
-        hearth_prop = MockObject("Candle", ["hearth", "props"])
-        desk_prop = MockObject("Pen", ["desk", "props"])
-        hearth_only = MockObject("Fireplace", ["hearth"])
-        desk_only = MockObject("Table", ["desk"])
-
-        query = "tag:hearth AND tag:props OR tag:desk AND tag:props"
-
-        # Hearth prop matches (has 'hearth' AND 'props')
-        self.assertTrue(query_parser.evaluate_query(query, hearth_prop))
-
-        # Desk prop matches (has 'desk' AND 'props')
-        self.assertTrue(query_parser.evaluate_query(query, desk_prop))
-
-        # Hearth only does NOT match (needs 'props')
-        self.assertFalse(query_parser.evaluate_query(query, hearth_only))
-
-        # Desk only does NOT match (needs 'props')
-        self.assertFalse(query_parser.evaluate_query(query, desk_only))
+        self.assertMatches(Q_HEARTH_AND_PROPS_OR_DESK_AND_PROPS, [
+            (make_object("Candle", ["hearth", "props"]), True),  # 'hearth' AND 'props'
+            (make_object("Pen", ["desk", "props"]), True),       # 'desk' AND 'props'
+            (make_object("Fireplace", ["hearth"]), False),       # needs 'props'
+            (make_object("Table", ["desk"]), False),             # needs 'props'
+        ])
 
     def test_filter_out_small_hero_objects(self):
         """Filter hero objects but exclude small ones."""
-        hero_large = MockObject("MainCharacter", ["hero", "large"])
-        hero_small = MockObject("Figurine", ["hero", "small"])
-        hero_medium = MockObject("Bust", ["hero"])
-        non_hero = MockObject("Rock", ["props"])
-
-        query = "tag:hero AND NOT tag:small"
-
-        # Hero large should match
-        self.assertTrue(query_parser.evaluate_query(query, hero_large))
-
-        # Hero small should NOT match
-        self.assertFalse(query_parser.evaluate_query(query, hero_small))
-
-        # Hero medium should match
-        self.assertTrue(query_parser.evaluate_query(query, hero_medium))
-
-        # Non-hero should NOT match
-        self.assertFalse(query_parser.evaluate_query(query, non_hero))
+        self.assertMatches(Q_HERO_NOT_SMALL, [
+            (make_object("MainCharacter", ["hero", "large"]), True),
+            (make_object("Figurine", ["hero", "small"]), False),
+            (make_object("Bust", ["hero"]), True),
+            (make_object("Rock", ["props"]), False),
+        ])
 
 
 class TestEdgeCases(unittest.TestCase):
@@ -366,13 +246,13 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_empty_query_returns_false(self):
         """Empty query should always return False."""
-        obj = MockObject("Cube", ["candle"])
+        obj = make_object("Cube", ["candle"])
         result = query_parser.evaluate_query("", obj)
         self.assertFalse(result)
 
     def test_malformed_query_fails_safe(self):
         """Malformed queries should fail safe (return False)."""
-        obj = MockObject("Cube", ["candle"])
+        obj = make_object("Cube", ["candle"])
 
         # Query without tag: prefix
         result = query_parser.evaluate_query("candle", obj)
@@ -380,10 +260,10 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_case_sensitive_tags(self):
         """Tags should be case-sensitive."""
-        obj = MockObject("Cube", ["Candle"])
+        obj = make_object("Cube", ["Candle"])
 
         # Lowercase query should not match uppercase tag
-        result = query_parser.evaluate_query("tag:candle", obj)
+        result = query_parser.evaluate_query(Q_CANDLE, obj)
         self.assertFalse(result)
 
         # Uppercase query should match uppercase tag
@@ -392,7 +272,7 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_tags_with_hyphens_and_underscores(self):
         """Tags with hyphens and underscores should work."""
-        obj = MockObject("Cube", ["hero-large", "main_character"])
+        obj = make_object("Cube", ["hero-large", "main_character"])
 
         result1 = query_parser.evaluate_query("tag:hero-large", obj)
         self.assertTrue(result1)
@@ -401,5 +281,58 @@ class TestEdgeCases(unittest.TestCase):
         self.assertTrue(result2)
 
 
+class MockScene:
+    """Mock Blender scene for testing."""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+
+class TestSceneMatching(unittest.TestCase):
+    """Test matching a query against every object in a scene."""
+
+    def setUp(self):
+        """Set up a scene with a few tagged objects."""
+        self.hero = make_object("Hero", ["hero"])
+        self.small_hero = make_object("SmallHero", ["hero", "small"])
+        self.desk = make_object("Desk", ["desk"])
+        self.scene = MockScene([self.hero, self.small_hero, self.desk])
+
+    def test_matching_objects(self):
+        """Only objects satisfying the query are returned."""
+        matching = query_parser.get_objects_matching_query(Q_HERO_NOT_SMALL, self.scene)
+        self.assertEqual(matching, [self.hero])
+
+    def test_single_tag_query(self):
+        """A single-tag query returns every object carrying that tag."""
+        matching = query_parser.get_objects_matching_query(Q_CANDLE, self.scene)
+        self.assertEqual(matching, [])
+
+        matching = query_parser.get_objects_matching_query("tag:hero", self.scene)
+        self.assertEqual(matching, [self.hero, self.small_hero])
+
+    def test_index_matching_keeps_scene_order(self):
+        """Index-answered queries return objects in scene order."""
+        matching = query_parser.get_objects_matching_query(
+            "tag:desk OR tag:hero AND NOT tag:small", self.scene
+        )
+        self.assertEqual(matching, [self.hero, self.desk])
+
+        # NOT-only clauses fall back to scanning every object
+        matching = query_parser.get_objects_matching_query("NOT tag:hero", self.scene)
+        self.assertEqual(matching, [self.desk])
+
+    def test_results_follow_tag_changes(self):
+        """Cached results are dropped once tags are marked dirty."""
+        query_parser.get_objects_matching_query(Q_DESK_OR_PROPS, self.scene)
+
+        props = make_object("Props", ["props"])
+        self.scene.objects.append(props)
+        utils.mark_tags_dirty()
+
+        matching = query_parser.get_objects_matching_query(Q_DESK_OR_PROPS, self.scene)
+        self.assertEqual(matching, [self.desk, props])
+
+
 if __name__ == '__main__':
     unittest.main()
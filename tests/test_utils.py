@@ -5,17 +5,11 @@ Tests tag manipulation, validation, and object filtering logic.
 """
 
 import unittest
-import sys
-from pathlib import Path
-import json
 
-# Add virtual_groups directory to path to import modules directly
-# This avoids importing __init__.py which requires bpy (Blender)
-virtual_groups_path = Path(__file__).parent.parent / "virtual_groups"
-sys.path.insert(0, str(virtual_groups_path))
-
-# Import utils module directly
-import utils
+try:
+    from .conftest import utils
+except ImportError:
+    from conftest import utils
 
 
 class MockObject:
@@ -45,6 +39,41 @@ class MockScene:
         self.objects = objects or []
 
 
+class MockTagRef:
+    """Mock VG_TagRef collection item for testing."""
+
+    def __init__(self, name=""):
+        self.name = name
+
+
+class MockCollection(list):
+    """Mock Blender CollectionProperty for testing."""
+
+    def add(self):
+        """Mock collection add: append and return a new item."""
+        item = MockTagRef()
+        self.append(item)
+        return item
+
+    def find(self, name):
+        """Mock collection find: index of the item with this name, or -1."""
+        for index, item in enumerate(self):
+            if item.name == name:
+                return index
+        return -1
+
+    def remove(self, index):
+        """Mock collection remove: remove the item at an index."""
+        del self[index]
+
+
+class MockProps:
+    """Mock scene vg_props property group for testing."""
+
+    def __init__(self, selected_tags=()):
+        self.selected_tags = MockCollection(MockTagRef(tag) for tag in selected_tags)
+
+
 class TestTagManipulation(unittest.TestCase):
     """Test tag manipulation functions."""
 
@@ -70,13 +99,64 @@ class TestTagManipulation(unittest.TestCase):
         tags = utils.get_tags_on_object(obj)
         self.assertEqual(tags, [])
 
+    def test_tags_stored_as_delimited_string(self):
+        """Tags are stored comma-joined; legacy JSON lists still read."""
+        obj = MockObject("Cube")
+        utils.set_tags_on_object(obj, ["candle", "desk"])
+        self.assertEqual(obj["vg_tags"], "candle,desk")
+
+        obj["vg_tags"] = '["props","hero"]'
+        self.assertEqual(utils.get_tags_on_object(obj), ["props", "hero"])
+
+        # The next write migrates the value
+        utils.add_tag_to_object(obj, "small")
+        self.assertEqual(obj["vg_tags"], "props,hero,small")
+
+    def test_invalid_tag_names_rejected(self):
+        """New names that fail validation are refused before any write."""
+        obj1 = MockObject("Cube")
+        obj2 = MockObject("Sphere")
+        utils.set_tags_on_object(obj1, ["candle"])
+
+        with self.assertRaises(ValueError):
+            utils.add_tag_to_object(obj1, "desk,props")
+        with self.assertRaises(ValueError):
+            utils.add_tags_to_objects([obj1, obj2], ["desk", "bad tag"])
+        self.assertEqual(obj1["vg_tags"], "candle")
+        self.assertIsNone(obj2.get("vg_tags"))
+
+    def test_legacy_json_keeps_invalid_names(self):
+        """Legacy names the delimited form can't hold survive reads and writes."""
+        obj = MockObject("Cube")
+        obj["vg_tags"] = '["props","a,b","hero"]'
+        self.assertEqual(utils.get_tags_on_object(obj), ["props", "a,b", "hero"])
+        self.assertTrue(utils.object_has_tag(obj, "a,b"))
+
+        # Writing keeps the JSON form instead of dropping "a,b"
+        utils.add_tag_to_object(obj, "small")
+        self.assertEqual(utils.get_tags_on_object(obj), ["props", "a,b", "hero", "small"])
+
+        # Once it is removed, the value migrates to the delimited form
+        utils.remove_tag_from_object(obj, "a,b")
+        self.assertEqual(obj["vg_tags"], "props,hero,small")
+
+    def test_get_tags_returns_independent_list(self):
+        """Modifying a returned tag list should not affect later reads."""
+        obj = MockObject("Cube")
+        utils.set_tags_on_object(obj, ["candle"])
+
+        tags = utils.get_tags_on_object(obj)
+        tags.append("desk")
+
+        self.assertEqual(utils.get_tags_on_object(obj), ["candle"])
+
     def test_add_tag_to_object(self):
         """Add tag to object."""
         obj = MockObject("Cube")
         utils.add_tag_to_object(obj, "candle")
 
         tags = utils.get_tags_on_object(obj)
-        self.assertIn("candle", tags)
+        self.assertEqual(tags, ["candle"])
 
     def test_add_duplicate_tag(self):
         """Adding duplicate tag should not create duplicates."""
@@ -85,7 +165,7 @@ class TestTagManipulation(unittest.TestCase):
         utils.add_tag_to_object(obj, "candle")
 
         tags = utils.get_tags_on_object(obj)
-        self.assertEqual(tags.count("candle"), 1)
+        self.assertEqual(tags, ["candle"])
 
     def test_add_multiple_tags(self):
         """Add multiple tags to object."""
@@ -95,10 +175,44 @@ class TestTagManipulation(unittest.TestCase):
         utils.add_tag_to_object(obj, "props")
 
         tags = utils.get_tags_on_object(obj)
-        self.assertEqual(len(tags), 3)
-        self.assertIn("candle", tags)
-        self.assertIn("desk", tags)
-        self.assertIn("props", tags)
+        self.assertEqual(tags, ["candle", "desk", "props"])
+
+    def test_add_tags_to_objects(self):
+        """Add tags to several objects, rewriting only those that change."""
+        obj1 = MockObject("Cube")
+        obj2 = MockObject("Sphere")
+        obj2["vg_tags"] = 'desk,candle'
+
+        utils.add_tags_to_objects([obj1, obj2], ["candle", "desk"])
+
+        self.assertEqual(utils.get_tags_on_object(obj1), ["candle", "desk"])
+        self.assertEqual(obj2["vg_tags"], 'desk,candle')
+
+    def test_remove_tags_from_objects(self):
+        """Remove tags from several objects, skipping ones without them."""
+        obj1 = MockObject("Cube")
+        obj2 = MockObject("Sphere")
+        utils.set_tags_on_object(obj1, ["candle", "desk"])
+        obj2["vg_tags"] = 'props'
+
+        utils.remove_tags_from_objects([obj1, obj2], ["candle"])
+
+        self.assertEqual(utils.get_tags_on_object(obj1), ["desk"])
+        self.assertEqual(obj2["vg_tags"], 'props')
+
+    def test_batch_modify_tags(self):
+        """Add and remove in one write per object; remove wins over add."""
+        obj1 = MockObject("Cube")
+        obj2 = MockObject("Sphere")
+        utils.set_tags_on_object(obj1, ["candle", "desk"])
+        obj2["vg_tags"] = 'props,hero'
+
+        utils.batch_modify_tags(
+            [obj1, obj2], add=["props", "hero", "small"], remove=["candle", "small"]
+        )
+
+        self.assertEqual(utils.get_tags_on_object(obj1), ["desk", "props", "hero"])
+        self.assertEqual(obj2["vg_tags"], 'props,hero')
 
     def test_remove_tag_from_object(self):
         """Remove tag from object."""
@@ -108,9 +222,7 @@ class TestTagManipulation(unittest.TestCase):
         utils.remove_tag_from_object(obj, "desk")
 
         tags = utils.get_tags_on_object(obj)
-        self.assertNotIn("desk", tags)
-        self.assertIn("candle", tags)
-        self.assertIn("props", tags)
+        self.assertEqual(tags, ["candle", "props"])
 
     def test_remove_nonexistent_tag(self):
         """Removing nonexistent tag should not error."""
@@ -134,52 +246,58 @@ class TestTagManipulation(unittest.TestCase):
         tags = utils.get_tags_on_object(obj)
         self.assertEqual(tags, [])
 
+    def test_object_has_tag(self):
+        """Raw-string tag check matches exact tags only."""
+        obj = MockObject("Cube")
+        utils.set_tags_on_object(obj, ["candle-holder", "desk"])
 
-class TestTagValidation(unittest.TestCase):
-    """Test tag name validation."""
-
-    def test_empty_tag(self):
-        """Empty tag should be invalid."""
-        is_valid, error = utils.validate_tag_name("")
-        self.assertFalse(is_valid)
-        self.assertIn("empty", error.lower())
-
-    def test_valid_alphanumeric_tag(self):
-        """Alphanumeric tag should be valid."""
-        is_valid, error = utils.validate_tag_name("candle123")
-        self.assertTrue(is_valid)
-        self.assertEqual(error, "")
-
-    def test_valid_tag_with_underscore(self):
-        """Tag with underscore should be valid."""
-        is_valid, error = utils.validate_tag_name("main_character")
-        self.assertTrue(is_valid)
-
-    def test_valid_tag_with_hyphen(self):
-        """Tag with hyphen should be valid."""
-        is_valid, error = utils.validate_tag_name("hero-large")
-        self.assertTrue(is_valid)
-
-    def test_invalid_tag_with_space(self):
-        """Tag with space should be invalid."""
-        is_valid, error = utils.validate_tag_name("my tag")
-        self.assertFalse(is_valid)
+        self.assertTrue(utils.object_has_tag(obj, "desk"))
+        self.assertFalse(utils.object_has_tag(obj, "candle"))
+        self.assertFalse(utils.object_has_tag(MockObject("Empty"), "desk"))
 
-    def test_invalid_tag_with_special_char(self):
-        """Tag with special characters should be invalid."""
-        is_valid, error = utils.validate_tag_name("tag@123")
-        self.assertFalse(is_valid)
+        # A quoted name inside a corrupted value is not a tag
+        obj["vg_tags"] = '["desk"'
+        self.assertFalse(utils.object_has_tag(obj, "desk"))
 
-        is_valid, error = utils.validate_tag_name("tag!name")
-        self.assertFalse(is_valid)
 
-        is_valid, error = utils.validate_tag_name("tag.name")
-        self.assertFalse(is_valid)
+class TestTagValidation(unittest.TestCase):
+    """Test tag name validation."""
 
-    def test_valid_mixed_case_tag(self):
-        """Mixed case tag should be valid."""
-        is_valid, error = utils.validate_tag_name("MyTag")
-        self.assertTrue(is_valid)
+    # (tag name, expected validity, expected error substring)
+    # An expected error of "" requires an empty message; None skips the check
+    CASES = [
+        # Empty tag
+        ("", False, "empty"),
+        # Valid: alphanumeric, underscore, hyphen, mixed case
+        ("candle123", True, ""),
+        ("main_character", True, ""),
+        ("hero-large", True, ""),
+        ("MyTag", True, ""),
+        # Invalid: spaces, special characters, trailing newline (the old
+        # `$`-anchored pattern let a single trailing newline through)
+        ("my tag", False, None),
+        ("tag@123", False, None),
+        ("tag!name", False, None),
+        ("tag.name", False, None),
+        ("candle\n", False, None),
+    ]
+
+    def test_validate_tag_name(self):
+        """Each tag name should validate as expected with a matching error."""
+        for tag, expected_valid, expected_error in self.CASES:
+            with self.subTest(tag=tag):
+                is_valid, error = utils.validate_tag_name(tag)
+                self.assertIs(is_valid, expected_valid)
+                if expected_error == "":
+                    self.assertEqual(error, "")
+                elif expected_error is not None:
+                    self.assertIn(expected_error, error.lower())
+
+    def test_legacy_trailing_newline_tag_still_read(self):
+        """A stored legacy tag the old pattern accepted isn't dropped on read."""
+        obj = MockObject("Cube")
+        obj["vg_tags"] = '["candle\\n","desk"]'
+        self.assertEqual(utils.get_tags_on_object(obj), ["candle\n", "desk"])
 
 
 class TestSceneTagEnumeration(unittest.TestCase):
@@ -202,10 +320,7 @@ class TestSceneTagEnumeration(unittest.TestCase):
         scene = MockScene([obj1, obj2])
         tags = utils.get_all_scene_tags(scene)
 
-        self.assertEqual(len(tags), 3)
-        self.assertIn("candle", tags)
-        self.assertIn("desk", tags)
-        self.assertIn("props", tags)
+        self.assertEqual(tags, ["candle", "desk", "props"])
 
     def test_scene_tags_are_sorted(self):
         """Tags should be returned in sorted order."""
@@ -233,75 +348,230 @@ class TestSceneTagEnumeration(unittest.TestCase):
 
         self.assertEqual(tags, ["candle"])
 
+    def test_scene_tags_cached_until_tags_change(self):
+        """The sorted tag list is reused until a tag write."""
+        obj1 = MockObject("Obj1")
+        utils.set_tags_on_object(obj1, ["desk"])
 
-class TestObjectFiltering(unittest.TestCase):
-    """Test object filtering by tags."""
-
-    def setUp(self):
-        """Set up test objects."""
-        self.obj1 = MockObject("Obj1")
-        utils.set_tags_on_object(self.obj1, ["candle", "desk"])
-
-        self.obj2 = MockObject("Obj2")
-        utils.set_tags_on_object(self.obj2, ["props", "desk"])
-
-        self.obj3 = MockObject("Obj3")
-        utils.set_tags_on_object(self.obj3, ["candle"])
+        scene = MockScene([obj1])
+        tags = utils.get_all_scene_tags(scene)
+        self.assertIs(utils.get_all_scene_tags(scene), tags)
 
-        self.obj4 = MockObject("Obj4")
-        utils.set_tags_on_object(self.obj4, [])
+        utils.add_tag_to_object(obj1, "candle")
+        self.assertEqual(utils.get_all_scene_tags(scene), ["candle", "desk"])
 
-        self.scene = MockScene([self.obj1, self.obj2, self.obj3, self.obj4])
+    def test_display_tags_exclude_membership_tags(self):
+        """Display tags drop view-* tags but keep look-alikes."""
+        obj1 = MockObject("Obj1")
+        utils.set_tags_on_object(obj1, ["view-abc123", "preview", "desk"])
 
-    def test_or_mode_single_tag(self):
-        """OR mode with single tag should return all objects with that tag."""
-        objects = utils.get_objects_with_tags(self.scene, ["candle"], mode='OR')
+        scene = MockScene([obj1])
+        self.assertEqual(utils.get_display_tags(scene), ["desk", "preview"])
+        self.assertIn("view-abc123", utils.get_all_scene_tags(scene))
 
-        self.assertEqual(len(objects), 2)
-        self.assertIn(self.obj1, objects)
-        self.assertIn(self.obj3, objects)
+    def test_display_tags_on_objects(self):
+        """Tags across several objects are merged, filtered and sorted."""
+        obj1 = MockObject("Obj1")
+        utils.set_tags_on_object(obj1, ["view-abc123", "desk"])
+        obj2 = MockObject("Obj2")
+        utils.set_tags_on_object(obj2, ["candle", "desk"])
 
-    def test_or_mode_multiple_tags(self):
-        """OR mode should return objects with any of the tags."""
-        objects = utils.get_objects_with_tags(self.scene, ["candle", "props"], mode='OR')
+        tags = utils.get_display_tags_on_objects([obj1, obj2])
+        self.assertEqual(tags, ("candle", "desk"))
+        self.assertEqual(utils.get_display_tags_on_objects([]), ())
 
-        self.assertEqual(len(objects), 3)
-        self.assertIn(self.obj1, objects)  # has candle
-        self.assertIn(self.obj2, objects)  # has props
-        self.assertIn(self.obj3, objects)  # has candle
 
-    def test_or_mode_no_matches(self):
-        """OR mode with no matching tags should return empty list."""
-        objects = utils.get_objects_with_tags(self.scene, ["nonexistent"], mode='OR')
-        self.assertEqual(len(objects), 0)
+def make_filter_scene():
+    """Build the four-object scene used by the filtering tests."""
+    objects = [MockObject(f"Obj{i}") for i in range(1, 5)]
+    for obj, tags in zip(objects, (["candle", "desk"], ["props", "desk"], ["candle"], [])):
+        utils.set_tags_on_object(obj, tags)
+    return objects, MockScene(list(objects))
 
-    def test_and_mode_single_tag(self):
-        """AND mode with single tag should behave like OR mode."""
-        objects = utils.get_objects_with_tags(self.scene, ["desk"], mode='AND')
 
-        self.assertEqual(len(objects), 2)
-        self.assertIn(self.obj1, objects)
-        self.assertIn(self.obj2, objects)
+class TestObjectFiltering(unittest.TestCase):
+    """Test object filtering by tags."""
 
-    def test_and_mode_multiple_tags(self):
-        """AND mode should return only objects with all tags."""
-        objects = utils.get_objects_with_tags(self.scene, ["candle", "desk"], mode='AND')
+    @classmethod
+    def setUpClass(cls):
+        """Set up test objects once; these tests only read them."""
+        _, cls.scene = make_filter_scene()
+
+    # (description, tags, mode, expected object names)
+    CASES = [
+        # OR mode: objects with any of the tags
+        ("or single tag", ["candle"], 'OR', {"Obj1", "Obj3"}),
+        ("or multiple tags", ["candle", "props"], 'OR', {"Obj1", "Obj2", "Obj3"}),
+        ("or no matches", ["nonexistent"], 'OR', set()),
+        # AND mode: objects with all of the tags
+        ("and single tag", ["desk"], 'AND', {"Obj1", "Obj2"}),
+        ("and multiple tags", ["candle", "desk"], 'AND', {"Obj1"}),
+        ("and no matches", ["candle", "props"], 'AND', set()),
+        # Empty tag list returns no objects in either mode
+        ("or empty tag list", [], 'OR', set()),
+        ("and empty tag list", [], 'AND', set()),
+    ]
+
+    def test_get_objects_with_tags(self):
+        """Each tag filter should return exactly the expected objects, in scene order."""
+        for description, tags, mode, expected in self.CASES:
+            with self.subTest(description):
+                objects = utils.get_objects_with_tags(self.scene, tags, mode=mode)
+                self.assertEqual([obj.name for obj in objects], sorted(expected))
+
+
+class TestTagIndexInvalidation(unittest.TestCase):
+    """Test that filtering sees tag changes made after earlier queries."""
 
-        self.assertEqual(len(objects), 1)
-        self.assertIn(self.obj1, objects)
+    def setUp(self):
+        """Set up fresh test objects; these tests modify them."""
+        objects, self.scene = make_filter_scene()
+        self.obj1, self.obj2, self.obj3, self.obj4 = objects
 
-    def test_and_mode_no_matches(self):
-        """AND mode with impossible combination should return empty list."""
-        objects = utils.get_objects_with_tags(self.scene, ["candle", "props"], mode='AND')
-        self.assertEqual(len(objects), 0)
+    def test_results_follow_tag_changes(self):
+        """Tag writes after a query should be reflected by the next query."""
+        utils.get_objects_with_tags(self.scene, ["candle"], mode='OR')
 
-    def test_empty_tag_list(self):
-        """Empty tag list should return empty results."""
-        objects = utils.get_objects_with_tags(self.scene, [], mode='OR')
-        self.assertEqual(len(objects), 0)
+        utils.add_tag_to_object(self.obj2, "candle")
+        utils.remove_tag_from_object(self.obj3, "candle")
 
-        objects = utils.get_objects_with_tags(self.scene, [], mode='AND')
-        self.assertEqual(len(objects), 0)
+        objects = utils.get_objects_with_tags(self.scene, ["candle"], mode='OR')
+        self.assertEqual(set(objects), {self.obj1, self.obj2})
+
+    def test_mark_tags_dirty_picks_up_external_edits(self):
+        """Edits made outside the tag API are seen after mark_tags_dirty."""
+        utils.get_objects_with_tags(self.scene, ["props"], mode='OR')
+
+        # Write the property directly, as Blender's UI or undo would
+        self.obj4["vg_tags"] = 'props'
+        utils.mark_tags_dirty()
+
+        objects = utils.get_objects_with_tags(self.scene, ["props"], mode='OR')
+        self.assertEqual(set(objects), {self.obj2, self.obj4})
+
+    def test_index_updated_in_place_by_tag_writes(self):
+        """Tag writes move objects between buckets without a rebuild."""
+        index = utils.get_tag_index(self.scene)
+
+        utils.add_tag_to_object(self.obj4, "props")
+        utils.remove_tag_from_object(self.obj1, "candle")
+        utils.remove_tag_from_object(self.obj3, "candle")
+
+        self.assertIs(utils.get_tag_index(self.scene), index)
+        self.assertEqual(index["props"], {self.obj2, self.obj4})
+        self.assertNotIn("candle", index)
+        self.assertEqual(utils.get_all_scene_tags(self.scene), ["desk", "props"])
+
+    def test_object_positions_follow_scene_order(self):
+        """Object positions index into scene.objects."""
+        positions = utils.get_object_positions(self.scene)
+        self.assertEqual(
+            positions, {obj: i for i, obj in enumerate(self.scene.objects)}
+        )
+
+        # Tag writes don't move objects
+        utils.add_tag_to_object(self.obj4, "props")
+        self.assertIs(utils.get_object_positions(self.scene), positions)
+
+    def test_verified_object_positions_rebuild_stale_index(self):
+        """Verified positions catch objects added or swapped behind the index."""
+        utils.get_object_positions(self.scene)
+
+        # Added without an update reaching the index
+        obj5 = MockObject("Obj5")
+        self.scene.objects.append(obj5)
+        self.assertNotIn(obj5, utils.get_object_positions(self.scene))
+        positions = utils.get_object_positions(self.scene, verify=True)
+        self.assertEqual(positions[obj5], 4)
+
+        # Same count, different object
+        obj6 = MockObject("Obj6")
+        self.scene.objects[0] = obj6
+        positions = utils.get_object_positions(self.scene, verify=True)
+        self.assertEqual(positions[obj6], 0)
+        self.assertNotIn(self.obj1, positions)
+
+        # In sync: no rebuild
+        self.assertIs(utils.get_object_positions(self.scene, verify=True), positions)
+
+    def test_api_write_after_unseen_external_edit(self):
+        """API writes correct the index even after edits it never saw."""
+        utils.get_tag_index(self.scene)
+
+        # Direct writes (e.g. from a script) don't reach the index
+        self.obj4["vg_tags"] = "foo"
+        utils.remove_tag_from_object(self.obj4, "foo")
+        self.assertEqual(utils.get_objects_with_tags(self.scene, ["foo"]), [])
+
+        self.obj3["vg_tags"] = ""
+        utils.add_tag_to_object(self.obj3, "props")
+        objects = utils.get_objects_with_tags(self.scene, ["candle"])
+        self.assertEqual(objects, [self.obj1])
+        objects = utils.get_objects_with_tags(self.scene, ["props"])
+        self.assertEqual(set(objects), {self.obj2, self.obj3})
+
+    def test_sync_object_tags(self):
+        """Syncing updated objects patches the index; new objects rebuild it."""
+        index = utils.get_tag_index(self.scene)
+        revision = utils.get_tag_revision()
+
+        # Unchanged objects leave every cache valid
+        utils.sync_object_tags(self.scene, [self.obj1, self.obj4])
+        self.assertEqual(utils.get_tag_revision(), revision)
+
+        # Edited behind the tag API (e.g. the custom property panel)
+        self.obj4["vg_tags"] = "props"
+        utils.sync_object_tags(self.scene, [self.obj4])
+        self.assertIs(utils.get_tag_index(self.scene), index)
+        self.assertEqual(index["props"], {self.obj2, self.obj4})
+
+        # An object the index hasn't seen forces a rebuild
+        obj5 = MockObject("Obj5")
+        obj5["vg_tags"] = "props"
+        self.scene.objects.append(obj5)
+        utils.sync_object_tags(self.scene, [obj5])
+        objects = utils.get_objects_with_tags(self.scene, ["props"], mode='OR')
+        self.assertEqual(set(objects), {self.obj2, self.obj4, obj5})
+
+    def test_sync_object_tags_removal_and_other_scene(self):
+        """Removed objects and edits from another scene invalidate the index."""
+        utils.get_tag_index(self.scene)
+
+        # A scene-only update (object deleted) re-checks the object count
+        self.scene.objects.remove(self.obj3)
+        utils.sync_object_tags(self.scene, [])
+        objects = utils.get_objects_with_tags(self.scene, ["candle"])
+        self.assertEqual(objects, [self.obj1])
+
+        # An object shared with another scene, edited from there
+        revision = utils.get_tag_revision()
+        self.obj1["vg_tags"] = "desk"
+        utils.sync_object_tags(MockScene([self.obj1]), [self.obj1])
+        self.assertNotEqual(utils.get_tag_revision(), revision)
+        self.assertEqual(utils.get_objects_with_tags(self.scene, ["candle"]), [])
+
+
+class TestTagPaletteSelection(unittest.TestCase):
+    """Test Tag Palette selection helpers."""
+
+    def test_get_selected_tag_set(self):
+        """Selection should read back as a set of tag names."""
+        props = MockProps(["candle", "desk"])
+        self.assertEqual(utils.get_selected_tag_set(props), {"candle", "desk"})
+
+        props.selected_tags.clear()
+        self.assertEqual(utils.get_selected_tag_set(props), frozenset())
+
+    def test_toggle_selected_tag(self):
+        """Toggling adds an unselected tag and removes a selected one."""
+        props = MockProps(["candle", "desk"])
+
+        utils.toggle_selected_tag(props, "props")
+        utils.toggle_selected_tag(props, "candle")
+
+        self.assertEqual(
+            [item.name for item in props.selected_tags], ["desk", "props"]
+        )
 
 
 if __name__ == '__main__':
@@ -23,6 +23,7 @@ import bpy
 from . import properties
 from . import operators
 from . import ui
+from . import handlers
 from . import utils
 from . import query_parser
 
@@ -31,6 +32,7 @@ modules = (
     properties,
     operators,
     ui,
+    handlers,
 )
 
 
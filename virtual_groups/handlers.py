@@ -0,0 +1,211 @@
+"""
+Handlers module for Virtual Groups
+
+Application handlers that keep cached tag data in sync with Blender:
+- File load and undo/redo invalidate the tag index
+- Depsgraph updates patch it for the updated objects; only collection
+  changes (objects linked/unlinked or reordered) invalidate it
+- Object visibility changes refresh the View list's cached icons
+- Viewport redraw requests are coalesced into one timer tick
+"""
+
+import bpy
+import numpy
+from bpy.app.handlers import persistent
+
+from . import utils
+
+
+# ============================================================================
+# Handlers
+# ============================================================================
+
+@persistent
+def invalidate_tag_cache(*_args):
+    """Mark cached tag lookups stale; they are rebuilt lazily on next use."""
+    utils.mark_tags_dirty()
+
+
+@persistent
+def sync_tag_cache(scene, depsgraph):
+    """
+    Update cached tag data from a depsgraph update, without dropping it.
+
+    Depsgraph updates fire on every transform and playback frame, so
+    invalidating here would rebuild the tag index (a full scene pass) on
+    the next redraw of every tick. Instead only the updated objects are
+    re-checked. Collection updates can add, remove or reorder scene
+    objects, so those still invalidate; Scene updates (e.g. an object
+    deleted from bpy.data) have the object count re-checked.
+    """
+    objects = []
+    scene_updated = False
+    for update in depsgraph.updates:
+        updated_id = update.id
+        if isinstance(updated_id, bpy.types.Collection):
+            utils.mark_tags_dirty()
+            return
+        if isinstance(updated_id, bpy.types.Scene):
+            scene_updated = True
+        elif isinstance(updated_id, bpy.types.Object):
+            objects.append(updated_id.original)
+
+    if objects or scene_updated:
+        utils.sync_object_tags(scene, objects)
+
+
+# Visibility arrays and what they were read against, from the last
+# refresh that walked the Views
+_visibility_snapshot = None
+
+
+@persistent
+def refresh_view_icon_states(scene, depsgraph):
+    """
+    Keep the View list's visibility icons in sync with the objects.
+
+    Icons are cached on each View so drawing the list never resolves
+    Views; this catches hide_viewport/hide_render changes made outside
+    our operators (outliner restriction toggles, scripts). The view
+    layer's hide flag (H/Alt+H) is not tracked. Moves and edits can't
+    change visibility, so updates carrying only those are skipped, and
+    the Views are only walked when the bulk-read visibility (or the tag
+    index they resolve from) differs from the last refresh.
+    """
+    global _visibility_snapshot
+
+    if not any(
+        isinstance(update.id, bpy.types.Object)
+        and not (update.is_updated_transform or update.is_updated_geometry)
+        for update in depsgraph.updates
+    ):
+        return
+
+    views = scene.vg_views
+    if not views:
+        return
+
+    # Read every object's visibility in two bulk RNA calls, then look
+    # each View's objects up by position instead of per-object reads.
+    # Positions are verified up front, so Views resolve from an index
+    # that matches scene.objects
+    positions = utils.get_object_positions(scene, verify=True)
+    count = len(scene.objects)
+    hidden = numpy.empty(count, dtype=bool)
+    render_hidden = numpy.empty(count, dtype=bool)
+    scene.objects.foreach_get("hide_viewport", hidden)
+    scene.objects.foreach_get("hide_render", render_hidden)
+
+    # Material, modifier and property edits land here too; skip them
+    key = (scene.as_pointer(), utils.get_tag_revision(), len(views))
+    snapshot = _visibility_snapshot
+    if (
+        snapshot is not None
+        and snapshot[0] == key
+        and numpy.array_equal(snapshot[1], hidden)
+        and numpy.array_equal(snapshot[2], render_hidden)
+    ):
+        return
+    _visibility_snapshot = (key, hidden, render_hidden)
+
+    for view in views:
+        rows = _object_rows(positions, utils.get_objects_in_view(view, scene))
+        # Empty View: any() over no rows is False, i.e. "all visible"
+        utils.set_view_icon_states(
+            view, not hidden[rows].any(), not render_hidden[rows].any()
+        )
+
+
+def _object_rows(positions, objects):
+    """Array of the objects' positions, skipping any not in the scene."""
+    rows = [positions[obj] for obj in objects if obj in positions]
+    return numpy.array(rows, dtype=numpy.intp)
+
+
+# Handler lists that should invalidate the tag cache
+handler_lists = (
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+)
+
+# depsgraph_update_post handlers, in run order (tags synced before icons)
+depsgraph_handlers = (
+    sync_tag_cache,
+    refresh_view_icon_states,
+)
+
+
+# ============================================================================
+# Redraw Coalescing
+# ============================================================================
+
+_redraw_pending = False
+
+
+def _flush_viewport_redraw():
+    """Tag every 3D viewport for redraw (timer callback, runs once)."""
+    global _redraw_pending
+    _redraw_pending = False
+
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+    # Returning None unregisters the timer
+    return None
+
+
+def request_viewport_redraw():
+    """
+    Schedule a redraw of every 3D viewport on the next timer tick.
+
+    Operators run back to back (e.g. from a shortcut held down) share a
+    single pending redraw instead of each walking the screen's areas.
+    """
+    global _redraw_pending
+    if _redraw_pending:
+        return
+
+    _redraw_pending = True
+    bpy.app.timers.register(_flush_viewport_redraw, first_interval=0.0)
+
+
+# ============================================================================
+# Registration
+# ============================================================================
+
+def register():
+    """Register application handlers."""
+    for handlers in handler_lists:
+        if invalidate_tag_cache not in handlers:
+            handlers.append(invalidate_tag_cache)
+
+    for handler in depsgraph_handlers:
+        if handler not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(handler)
+
+    utils.mark_tags_dirty()
+
+    print("Virtual Groups handlers registered")
+
+
+def unregister():
+    """Unregister application handlers."""
+    for handlers in handler_lists:
+        if invalidate_tag_cache in handlers:
+            handlers.remove(invalidate_tag_cache)
+
+    for handler in depsgraph_handlers:
+        if handler in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(handler)
+
+    # Drop a redraw still pending from the last operator
+    global _redraw_pending, _visibility_snapshot
+    if bpy.app.timers.is_registered(_flush_viewport_redraw):
+        bpy.app.timers.unregister(_flush_viewport_redraw)
+    _redraw_pending = False
+    _visibility_snapshot = None
+
+    print("Virtual Groups handlers unregistered")
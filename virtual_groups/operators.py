@@ -9,30 +9,33 @@ Contains all operator classes (button actions):
 """
 
 import bpy
-import uuid
+import secrets
+from operator import attrgetter, methodcaller
 from bpy.types import Operator
 from bpy.props import StringProperty, IntProperty
 
 # Import utilities (will be implemented in Phase 2+)
 from . import utils
 from . import query_parser
+from . import handlers
 
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
-def update_view_icon_states(view, scene):
-    """Update cached icon states for a view based on current object visibility."""
-    objects = utils.get_objects_in_view(view, scene)
+def _poll_has_active_view(context):
+    """
+    Shared poll check: the active View index points at an existing View.
 
-    if objects:
-        view.icon_all_visible = all(not obj.hide_viewport for obj in objects)
-        view.icon_all_render_visible = all(not obj.hide_render for obj in objects)
-    else:
-        # Empty view defaults to "all visible"
-        view.icon_all_visible = True
-        view.icon_all_render_visible = True
+    Args:
+        context: Blender context
+
+    Returns:
+        bool: True if a View is selected in the list
+    """
+    scene = context.scene
+    return 0 <= scene.vg_active_view_index < len(scene.vg_views)
 
 
 # ============================================================================
@@ -55,7 +58,7 @@ class VG_OT_add_tag_to_selected(Operator):
     @classmethod
     def poll(cls, context):
         # Only enabled if objects are selected
-        return len(context.selected_objects) > 0
+        return utils.has_viewport_selection(context)
 
     def invoke(self, context, _event):
         # Always reset tag_name first (prevents persistence from last use)
@@ -86,15 +89,16 @@ class VG_OT_add_tag_to_selected(Operator):
             return {'CANCELLED'}
 
         # Add tag to all selected objects
-        count = 0
-        for obj in context.selected_objects:
-            utils.add_tag_to_object(obj, tag)
-            count += 1
+        selected = context.selected_objects
+        try:
+            utils.add_tags_to_objects(selected, [tag])
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+        count = len(selected)
 
         # Force UI redraw to show new tag immediately
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         self.report({'INFO'}, f"Added tag '{tag}' to {count} object(s)")
         return {'FINISHED'}
@@ -114,7 +118,7 @@ class VG_OT_remove_tag_from_selected(Operator):
     @classmethod
     def poll(cls, context):
         # Only enabled if objects are selected
-        return len(context.selected_objects) > 0
+        return utils.has_viewport_selection(context)
 
     def execute(self, context):
         if not self.tag_name:
@@ -122,15 +126,12 @@ class VG_OT_remove_tag_from_selected(Operator):
             return {'CANCELLED'}
 
         # Remove tag from all selected objects
-        count = 0
-        for obj in context.selected_objects:
-            utils.remove_tag_from_object(obj, self.tag_name)
-            count += 1
+        selected = context.selected_objects
+        utils.remove_tags_from_objects(selected, [self.tag_name])
+        count = len(selected)
 
         # Force UI redraw to update tag list immediately
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         self.report({'INFO'}, f"Removed tag '{self.tag_name}' from {count} object(s)")
         return {'FINISHED'}
@@ -154,26 +155,37 @@ class VG_OT_toggle_tag_selection(Operator):
     def execute(self, context):
         props = context.scene.vg_props
 
-        # Get current selected tags as a set
-        selected_tags_str = props.selected_tags
-        selected_tags = set(selected_tags_str.split(',')) if selected_tags_str else set()
+        # Add or remove just this tag's entry in the selection collection
+        utils.toggle_selected_tag(props, self.tag_name)
+
+        # Force UI redraw
+        handlers.request_viewport_redraw()
 
-        # Remove empty strings
-        selected_tags.discard('')
+        return {'FINISHED'}
 
-        # Toggle the tag
-        if self.tag_name in selected_tags:
-            selected_tags.remove(self.tag_name)
-        else:
-            selected_tags.add(self.tag_name)
 
-        # Save back to property as comma-separated string
-        props.selected_tags = ','.join(sorted(selected_tags))
+class VG_OT_tag_palette_page(Operator):
+    """Show the previous or next page of the Tag Palette"""
+    bl_idname = "virtual_groups.tag_palette_page"
+    bl_label = "Change Tag Page"
+    bl_options = {'INTERNAL'}
 
-        # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+    delta = IntProperty(
+        name="Delta",
+        description="Number of pages to move (negative moves back)",
+        default=1
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.vg_props
+
+        # Clamp to the pages that currently exist (tags may have been removed)
+        num_tags = len(utils.get_display_tags(scene))
+        last_page = max(0, (num_tags - 1) // props.tag_palette_page_size)
+        # The stored page can be past the end after tags were removed
+        page = min(props.tag_palette_page, last_page)
+        props.tag_palette_page = min(max(page + self.delta, 0), last_page)
 
         return {'FINISHED'}
 
@@ -188,26 +200,30 @@ class VG_OT_tag_palette_hide(Operator):
     def poll(cls, context):
         # Only enabled when tags are selected
         props = context.scene.vg_props
-        return bool(props.selected_tags.strip())
+        return len(props.selected_tags) > 0
 
     def execute(self, context):
         props = context.scene.vg_props
-        selected_tags = [t for t in props.selected_tags.split(',') if t]
+        selected_tags = utils.get_selected_tag_set(props)
 
         # Get all objects with any of the selected tags (OR logic)
         objects = utils.get_objects_with_tags(context.scene, selected_tags, mode='OR')
 
+        # Nothing to change: clear the selection and skip the redraw
+        if not objects:
+            props.selected_tags.clear()
+            self.report({'INFO'}, "No matching objects")
+            return {'FINISHED'}
+
         # Hide them
         for obj in objects:
             obj.hide_viewport = True
 
         # Auto-clear tag selection
-        props.selected_tags = ""
+        props.selected_tags.clear()
 
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         self.report({'INFO'}, f"Hid {len(objects)} object(s)")
         return {'FINISHED'}
@@ -223,26 +239,30 @@ class VG_OT_tag_palette_show(Operator):
     def poll(cls, context):
         # Only enabled when tags are selected
         props = context.scene.vg_props
-        return bool(props.selected_tags.strip())
+        return len(props.selected_tags) > 0
 
     def execute(self, context):
         props = context.scene.vg_props
-        selected_tags = [t for t in props.selected_tags.split(',') if t]
+        selected_tags = utils.get_selected_tag_set(props)
 
         # Get all objects with any of the selected tags (OR logic)
         objects = utils.get_objects_with_tags(context.scene, selected_tags, mode='OR')
 
+        # Nothing to change: clear the selection and skip the redraw
+        if not objects:
+            props.selected_tags.clear()
+            self.report({'INFO'}, "No matching objects")
+            return {'FINISHED'}
+
         # Show them
         for obj in objects:
             obj.hide_viewport = False
 
         # Auto-clear tag selection
-        props.selected_tags = ""
+        props.selected_tags.clear()
 
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         self.report({'INFO'}, f"Showed {len(objects)} object(s)")
         return {'FINISHED'}
@@ -258,26 +278,30 @@ class VG_OT_tag_palette_toggle(Operator):
     def poll(cls, context):
         # Only enabled when tags are selected
         props = context.scene.vg_props
-        return bool(props.selected_tags.strip())
+        return len(props.selected_tags) > 0
 
     def execute(self, context):
         props = context.scene.vg_props
-        selected_tags = [t for t in props.selected_tags.split(',') if t]
+        selected_tags = utils.get_selected_tag_set(props)
 
         # Get all objects with any of the selected tags (OR logic)
         objects = utils.get_objects_with_tags(context.scene, selected_tags, mode='OR')
 
+        # Nothing to change: clear the selection and skip the redraw
+        if not objects:
+            props.selected_tags.clear()
+            self.report({'INFO'}, "No matching objects")
+            return {'FINISHED'}
+
         # Toggle visibility
         for obj in objects:
             obj.hide_viewport = not obj.hide_viewport
 
         # Auto-clear tag selection
-        props.selected_tags = ""
+        props.selected_tags.clear()
 
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         self.report({'INFO'}, f"Toggled visibility for {len(objects)} object(s)")
         return {'FINISHED'}
@@ -293,29 +317,34 @@ class VG_OT_tag_palette_select(Operator):
     def poll(cls, context):
         # Only enabled when tags are selected
         props = context.scene.vg_props
-        return bool(props.selected_tags.strip())
+        return len(props.selected_tags) > 0
 
     def execute(self, context):
         props = context.scene.vg_props
-        selected_tags = [t for t in props.selected_tags.split(',') if t]
+        selected_tags = utils.get_selected_tag_set(props)
 
         # Get all objects with any of the selected tags (OR logic)
         objects = utils.get_objects_with_tags(context.scene, selected_tags, mode='OR')
 
-        # Deselect all first
-        bpy.ops.object.select_all(action='DESELECT')
+        # Nothing to change: clear the selection and skip the redraw
+        if not objects:
+            props.selected_tags.clear()
+            self.report({'INFO'}, "No matching objects")
+            return {'FINISHED'}
+
+        # Deselect all first (directly, avoiding the select_all operator)
+        for obj in context.selected_objects:
+            obj.select_set(False)
 
         # Select matching objects
         for obj in objects:
             obj.select_set(True)
 
         # Auto-clear tag selection
-        props.selected_tags = ""
+        props.selected_tags.clear()
 
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         self.report({'INFO'}, f"Selected {len(objects)} object(s)")
         return {'FINISHED'}
@@ -331,29 +360,32 @@ class VG_OT_tag_palette_add_tags(Operator):
     def poll(cls, context):
         # Only enabled when tags are selected AND objects are selected in viewport
         props = context.scene.vg_props
-        has_tags = bool(props.selected_tags.strip())
-        has_selection = len(context.selected_objects) > 0
+        has_tags = len(props.selected_tags) > 0
+        has_selection = utils.has_viewport_selection(context)
         return has_tags and has_selection
 
     def execute(self, context):
         props = context.scene.vg_props
-        selected_tags = [t for t in props.selected_tags.split(',') if t]
-
-        # Add all selected tags to all selected objects
-        for obj in context.selected_objects:
-            for tag in selected_tags:
-                utils.add_tag_to_object(obj, tag)
+        selected_tags = sorted(utils.get_selected_tag_set(props))
+        selected = context.selected_objects
+
+        # Add all selected tags to all selected objects. Names are checked
+        # before any object is written, so a legacy name that no longer
+        # validates cancels the whole batch
+        try:
+            utils.add_tags_to_objects(selected, selected_tags)
+        except ValueError as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
 
         # Auto-clear tag selection
-        props.selected_tags = ""
+        props.selected_tags.clear()
 
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         tag_str = ', '.join(selected_tags)
-        self.report({'INFO'}, f"Added tags [{tag_str}] to {len(context.selected_objects)} object(s)")
+        self.report({'INFO'}, f"Added tags [{tag_str}] to {len(selected)} object(s)")
         return {'FINISHED'}
 
 
@@ -367,29 +399,26 @@ class VG_OT_tag_palette_remove_tags(Operator):
     def poll(cls, context):
         # Only enabled when tags are selected AND objects are selected in viewport
         props = context.scene.vg_props
-        has_tags = bool(props.selected_tags.strip())
-        has_selection = len(context.selected_objects) > 0
+        has_tags = len(props.selected_tags) > 0
+        has_selection = utils.has_viewport_selection(context)
         return has_tags and has_selection
 
     def execute(self, context):
         props = context.scene.vg_props
-        selected_tags = [t for t in props.selected_tags.split(',') if t]
+        selected_tags = sorted(utils.get_selected_tag_set(props))
+        selected = context.selected_objects
 
         # Remove all selected tags from all selected objects
-        for obj in context.selected_objects:
-            for tag in selected_tags:
-                utils.remove_tag_from_object(obj, tag)
+        utils.remove_tags_from_objects(selected, selected_tags)
 
         # Auto-clear tag selection
-        props.selected_tags = ""
+        props.selected_tags.clear()
 
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         tag_str = ', '.join(selected_tags)
-        self.report({'INFO'}, f"Removed tags [{tag_str}] from {len(context.selected_objects)} object(s)")
+        self.report({'INFO'}, f"Removed tags [{tag_str}] from {len(selected)} object(s)")
         return {'FINISHED'}
 
 
@@ -424,9 +453,8 @@ class VG_OT_add_view(Operator):
         scene = context.scene
         new_view = scene.vg_views.add()
         new_view.name = name
-        new_view.guid = str(uuid.uuid4())
+        new_view.guid = secrets.token_hex(16)
         new_view.query = ""
-        new_view.cached_count = 0
         new_view.icon_all_visible = True  # Default to all visible
         new_view.icon_all_render_visible = True  # Default to all render visible
 
@@ -434,9 +462,7 @@ class VG_OT_add_view(Operator):
         scene.vg_active_view_index = len(scene.vg_views) - 1
 
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         self.report({'INFO'}, f"Created View '{name}'")
         return {'FINISHED'}
@@ -479,11 +505,9 @@ class VG_OT_delete_view(Operator):
         # Clean up membership tags from all objects before deleting
         if view.guid:
             membership_tag = f"view-{view.guid}"
-            removed_count = 0
-            for obj in scene.objects:
-                if membership_tag in utils.get_tags_on_object(obj):
-                    utils.remove_tag_from_object(obj, membership_tag)
-                    removed_count += 1
+            members = list(utils.get_tag_index(scene).get(membership_tag, ()))
+            utils.batch_modify_tags(members, remove=[membership_tag])
+            removed_count = len(members)
 
             if removed_count > 0:
                 print(f"[Virtual Groups] Cleaned up membership tag from {removed_count} object(s)")
@@ -496,9 +520,7 @@ class VG_OT_delete_view(Operator):
             scene.vg_active_view_index = len(scene.vg_views) - 1
 
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         self.report({'INFO'}, f"Deleted View '{view_name}'")
         return {'FINISHED'}
@@ -513,8 +535,7 @@ class VG_OT_apply_query(Operator):
     @classmethod
     def poll(cls, context):
         # Only enabled if there's a view selected
-        scene = context.scene
-        return len(scene.vg_views) > 0 and 0 <= scene.vg_active_view_index < len(scene.vg_views)
+        return _poll_has_active_view(context)
 
     def execute(self, context):
         scene = context.scene
@@ -536,16 +557,11 @@ class VG_OT_apply_query(Operator):
         # Get matching objects (hybrid: query + membership)
         matching_objects = utils.get_objects_in_view(view, scene)
 
-        # Update cached count
-        view.cached_count = len(matching_objects)
-
         # Update icon states
-        update_view_icon_states(view, scene)
+        utils.update_view_icon_states(view, scene, matching_objects)
 
         # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        handlers.request_viewport_redraw()
 
         self.report({'INFO'}, f"Query matched {len(matching_objects)} object(s)")
         return {'FINISHED'}
@@ -565,10 +581,7 @@ class VG_OT_add_to_view(Operator):
     @classmethod
     def poll(cls, context):
         # Only enabled if there's a view selected AND objects are selected
-        scene = context.scene
-        if len(scene.vg_views) == 0 or not (0 <= scene.vg_active_view_index < len(scene.vg_views)):
-            return False
-        return utils.has_viewport_selection(context)
+        return _poll_has_active_view(context) and utils.has_viewport_selection(context)
 
     def execute(self, context):
         scene = context.scene
@@ -579,22 +592,20 @@ class VG_OT_add_to_view(Operator):
             return {'CANCELLED'}
 
         membership_tag = f"view-{view.guid}"
-        count = 0
 
         # Add membership tag to all selected objects
-        for obj in context.selected_objects:
-            utils.add_tag_to_object(obj, membership_tag)
-            count += 1
+        selected = context.selected_objects
+        try:
+            utils.batch_modify_tags(selected, add=[membership_tag])
+        except ValueError as error:
+            # A hand-edited GUID can make an invalid membership tag
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+        count = len(selected)
 
-        # Update cached count and icon states
+        # Update icon states
         matching_objects = utils.get_objects_in_view(view, scene)
-        view.cached_count = len(matching_objects)
-        update_view_icon_states(view, scene)
-
-        # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        utils.update_view_icon_states(view, scene, matching_objects)
 
         self.report({'INFO'}, f"Added {count} object(s) to View '{view.name}'")
         return {'FINISHED'}
@@ -610,10 +621,7 @@ class VG_OT_remove_from_view(Operator):
     @classmethod
     def poll(cls, context):
         # Only enabled if there's a view selected AND objects are selected
-        scene = context.scene
-        if len(scene.vg_views) == 0 or not (0 <= scene.vg_active_view_index < len(scene.vg_views)):
-            return False
-        return utils.has_viewport_selection(context)
+        return _poll_has_active_view(context) and utils.has_viewport_selection(context)
 
     def execute(self, context):
         scene = context.scene
@@ -624,22 +632,15 @@ class VG_OT_remove_from_view(Operator):
             return {'CANCELLED'}
 
         membership_tag = f"view-{view.guid}"
-        count = 0
 
         # Remove membership tag from all selected objects
-        for obj in context.selected_objects:
-            utils.remove_tag_from_object(obj, membership_tag)
-            count += 1
+        selected = context.selected_objects
+        utils.batch_modify_tags(selected, remove=[membership_tag])
+        count = len(selected)
 
-        # Update cached count and icon states
+        # Update icon states
         matching_objects = utils.get_objects_in_view(view, scene)
-        view.cached_count = len(matching_objects)
-        update_view_icon_states(view, scene)
-
-        # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        utils.update_view_icon_states(view, scene, matching_objects)
 
         self.report({'INFO'}, f"Removed {count} object(s) from View '{view.name}'")
         return {'FINISHED'}
@@ -655,10 +656,7 @@ class VG_OT_clear_view_membership(Operator):
     @classmethod
     def poll(cls, context):
         # Only enabled if there's a view selected
-        scene = context.scene
-        if len(scene.vg_views) == 0 or not (0 <= scene.vg_active_view_index < len(scene.vg_views)):
-            return False
-        return True
+        return _poll_has_active_view(context)
 
     def execute(self, context):
         scene = context.scene
@@ -669,23 +667,17 @@ class VG_OT_clear_view_membership(Operator):
             return {'CANCELLED'}
 
         membership_tag = f"view-{view.guid}"
-        count = 0
 
-        # Remove membership tag from ALL objects in scene
-        for obj in scene.objects:
-            if membership_tag in utils.get_tags_on_object(obj):
-                utils.remove_tag_from_object(obj, membership_tag)
-                count += 1
+        # Remove membership tag from ALL objects in scene. Not just the view
+        # layer: members hidden from it would otherwise keep a stale tag.
+        # The tag index bucket already lists exactly those objects.
+        members = list(utils.get_tag_index(scene).get(membership_tag, ()))
+        utils.batch_modify_tags(members, remove=[membership_tag])
+        count = len(members)
 
-        # Update cached count and icon states
+        # Update icon states
         matching_objects = utils.get_objects_in_view(view, scene)
-        view.cached_count = len(matching_objects)
-        update_view_icon_states(view, scene)
-
-        # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        utils.update_view_icon_states(view, scene, matching_objects)
 
         self.report({'INFO'}, f"Cleared {count} object(s) from membership in View '{view.name}'")
         return {'FINISHED'}
@@ -736,20 +728,24 @@ class VG_OT_toggle_view_visibility(Operator):
             self.report({'WARNING'}, "View has no objects")
             return {'CANCELLED'}
 
-        # Check current state - are all objects visible?
-        all_visible = all(not obj.hide_viewport for obj in objects)
+        # Check current state - are all objects visible? (read each once;
+        # map + attrgetter keeps the per-object loop out of bytecode)
+        hidden = list(map(attrgetter("hide_viewport"), objects))
+        all_visible = not any(hidden)
 
-        # Toggle: if all visible, hide all; otherwise show all
-        for obj in objects:
-            obj.hide_viewport = all_visible
+        # Toggle: if all visible, hide all; otherwise show all.
+        # Only write objects that change; each write tags the depsgraph.
+        for obj, is_hidden in zip(objects, hidden):
+            if is_hidden != all_visible:
+                obj.hide_viewport = all_visible
 
         # Update cached icon state for this view
         view.icon_all_visible = not all_visible
 
-        # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        # Redraw the panel hosting the View list (object changes already
+        # notify every viewport)
+        if context.area is not None:
+            context.area.tag_redraw()
 
         action = "Hid" if all_visible else "Showed"
         self.report({'INFO'}, f"{action} {len(objects)} object(s) in View '{view.name}'")
@@ -798,22 +794,23 @@ class VG_OT_toggle_view_selection(Operator):
             return {'CANCELLED'}
 
         # Get all objects including children (recursive)
-        all_objects = []
-        for obj in objects:
-            all_objects.append(obj)
-            all_objects.extend(obj.children_recursive)
+        all_objects = utils.get_objects_with_children(objects, scene)
 
-        # Check current state - are all objects selected?
-        all_selected = all(obj.select_get() for obj in all_objects)
+        # Check current state - are all objects selected? (read each once)
+        selected = list(map(methodcaller("select_get"), all_objects))
+        all_selected = all(selected)
 
-        # Toggle (compositional - add or remove from selection)
-        for obj in all_objects:
-            obj.select_set(not all_selected)
+        # Toggle (compositional - add or remove from selection),
+        # skipping objects already in the target state
+        select = not all_selected
+        for obj, is_selected in zip(all_objects, selected):
+            if is_selected != select:
+                obj.select_set(select)
 
-        # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        # Redraw the panel hosting the View list (object changes already
+        # notify every viewport)
+        if context.area is not None:
+            context.area.tag_redraw()
 
         action = "Deselected" if all_selected else "Selected"
         self.report({'INFO'}, f"{action} {len(all_objects)} object(s) from View '{view.name}'")
@@ -861,20 +858,23 @@ class VG_OT_toggle_view_render_visibility(Operator):
             self.report({'WARNING'}, "View has no objects")
             return {'CANCELLED'}
 
-        # Check current state - are all objects render-visible?
-        all_render_visible = all(not obj.hide_render for obj in objects)
+        # Check current state - are all objects render-visible? (read each once)
+        hidden = list(map(attrgetter("hide_render"), objects))
+        all_render_visible = not any(hidden)
 
-        # Toggle: if all render-visible, hide from render; otherwise show in render
-        for obj in objects:
-            obj.hide_render = all_render_visible
+        # Toggle: if all render-visible, hide from render; otherwise show in render.
+        # Only write objects that change; each write tags the depsgraph.
+        for obj, is_hidden in zip(objects, hidden):
+            if is_hidden != all_render_visible:
+                obj.hide_render = all_render_visible
 
         # Update cached icon state for this view
         view.icon_all_render_visible = not all_render_visible
 
-        # Force UI redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        # Redraw the panel hosting the View list (object changes already
+        # notify every viewport)
+        if context.area is not None:
+            context.area.tag_redraw()
 
         action = "Hid from render" if all_render_visible else "Enabled for render"
         self.report({'INFO'}, f"{action} {len(objects)} object(s) in View '{view.name}'")
@@ -891,6 +891,7 @@ classes = (
     VG_OT_remove_tag_from_selected,
     # Tag Palette
     VG_OT_toggle_tag_selection,
+    VG_OT_tag_palette_page,
     VG_OT_tag_palette_hide,
     VG_OT_tag_palette_show,
     VG_OT_tag_palette_toggle,
@@ -911,18 +912,19 @@ classes = (
     VG_OT_toggle_view_render_visibility,
 )
 
+# Builds register/unregister callables for the tuple (unregister runs in reverse)
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 
 def register():
     """Register all operator classes."""
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     
     print("Virtual Groups operators registered")
 
 
 def unregister():
     """Unregister all operator classes."""
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
     
     print("Virtual Groups operators unregistered")
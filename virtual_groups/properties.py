@@ -17,6 +17,34 @@ from bpy.props import (
 )
 from bpy.types import PropertyGroup
 
+from . import utils
+
+
+# ============================================================================
+# Property Getters
+# ============================================================================
+
+def _get_cached_count(self):
+    """
+    Count the objects in a View on demand.
+
+    Backed by the per-revision View cache in utils, so repeated reads
+    (e.g. every UIList redraw) are free until tags change. Views with no
+    query and no members (e.g. freshly added ones) are counted from the
+    tag index alone, without resolving them.
+
+    Args:
+        self: VG_ViewProperty being read
+
+    Returns:
+        int: Number of objects in the View
+    """
+    scene = self.id_data
+    if not self.query.strip() and f"view-{self.guid}" not in utils.get_tag_index(scene):
+        return 0
+
+    return len(utils.get_objects_in_view(self, scene))
+
 
 # ============================================================================
 # Property Classes
@@ -45,8 +73,8 @@ class VG_ViewProperty(PropertyGroup):
 
     cached_count: IntProperty(
         name="Cached Count",
-        description="Number of objects matching this query (cached)",
-        default=0
+        description="Number of objects in this View (computed on demand)",
+        get=_get_cached_count
     )
 
     show_query_section: BoolProperty(
@@ -55,7 +83,7 @@ class VG_ViewProperty(PropertyGroup):
         default=False
     )
 
-    # Cached icon states (updated by operators, displayed in UIList)
+    # Cached icon states (updated by operators and on object updates, displayed in UIList)
     icon_all_visible: BoolProperty(
         name="All Visible",
         description="Cached state: all objects in view are visible in viewport",
@@ -69,14 +97,51 @@ class VG_ViewProperty(PropertyGroup):
     )
 
 
+class VG_TagRef(PropertyGroup):
+    """Property group naming a single tag (e.g. a Tag Palette selection)."""
+
+    name: StringProperty(
+        name="Tag",
+        description="Tag name",
+        default=""
+    )
+
+
 class VG_SceneProperties(PropertyGroup):
     """Scene-level properties for Virtual Groups."""
     
     # Tag Palette state
-    selected_tags: StringProperty(
+    selected_tags: CollectionProperty(
+        type=VG_TagRef,
         name="Selected Tags",
-        description="Comma-separated list of selected tags in Tag Palette",
-        default=""
+        description="Tags selected in the Tag Palette"
+    )
+    
+    show_scene_tags: BoolProperty(
+        name="Show Scene Tags",
+        description="Show/hide the Tag Palette's tag pills",
+        default=True
+    )
+    
+    # Tag Palette pagination (bounds the number of pills drawn per redraw)
+    tag_palette_page: IntProperty(
+        name="Tag Page",
+        description="Page of the Tag Palette currently shown",
+        default=0,
+        min=0
+    )
+    
+    tag_palette_page_size: IntProperty(
+        name="Tags per Page",
+        description="Maximum number of tags shown at once in the Tag Palette",
+        default=60,
+        min=1
+    )
+    
+    show_selected_tags: BoolProperty(
+        name="Show Selected Objects",
+        description="Show/hide the tags on selected objects",
+        default=True
     )
     
     # Placeholder properties for v1
@@ -110,15 +175,18 @@ class VG_SceneProperties(PropertyGroup):
 
 classes = (
     VG_ViewProperty,
+    VG_TagRef,
     VG_SceneProperties,
 )
 
+# Builds register/unregister callables for the tuple (unregister runs in reverse)
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 
 def register():
     """Register property classes and add to Scene."""
     # Register property group classes
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     
     # Add properties to Scene
     bpy.types.Scene.vg_views = CollectionProperty(
@@ -147,7 +215,6 @@ def unregister():
     del bpy.types.Scene.vg_views
     
     # Unregister property group classes
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
     
     print("Virtual Groups properties unregistered")
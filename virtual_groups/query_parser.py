@@ -5,13 +5,18 @@ Implements parsing and evaluation of tag queries:
 - Parse query syntax: tag:name AND/OR/NOT tag:name
 - Evaluate queries against objects
 - Get objects matching a query
-
-This will be fully implemented in Phase 4.
 """
 
+import functools
 import re
 from . import utils
 
+# Compiled once at import and shared by parsing and validation; tag names
+# follow the same rule as validate_tag_name
+_TAG_RE = re.compile(rf'tag:({utils.TAG_NAME_PATTERN})')
+_NOT_TAG_RE = re.compile(rf'NOT\s+tag:({utils.TAG_NAME_PATTERN})')
+_TRAILING_NOT_RE = re.compile(r'NOT\s*$')
+
 
 # ============================================================================
 # Query Parsing (Phase 4)
@@ -20,36 +25,107 @@ from . import utils
 def parse_query(query_string):
     """
     Parse a query string into a structured representation.
-    
+
     Query syntax:
         tag:tagname
         tag:tag1 AND tag:tag2
         tag:tag1 OR tag:tag2
         tag:tag1 AND NOT tag:tag2
-    
+
+    The query is split into OR clauses (lowest precedence), each made of
+    AND terms. A clause with a malformed term can never match, so it is
+    dropped; an empty or entirely malformed query parses to no clauses.
+
     Args:
         query_string: Query string to parse
-        
+
     Returns:
-        Structured representation of the query
-        
-    Note: Full implementation in Phase 4
+        tuple: One (required_tags, excluded_tags) pair of frozensets per
+        OR clause. An object matches the query if, for any clause, it has
+        all required tags and none of the excluded ones.
+    """
+    if not query_string.strip():
+        return ()
+
+    clauses = []
+    for or_clause in query_string.split(' OR '):
+        clause = _parse_and_clause(or_clause.strip())
+        if clause is not None:
+            clauses.append(clause)
+
+    return tuple(clauses)
+
+
+@functools.lru_cache(maxsize=128)
+def parse_cached(query_string):
     """
-    # TODO: Implement in Phase 4
-    pass
+    Parse a query string, reusing earlier results for the same string.
+
+    Args:
+        query_string: Query string to parse
+
+    Returns:
+        tuple: See parse_query (shared; do not modify)
+    """
+    return parse_query(query_string)
+
+
+def _parse_and_clause(clause):
+    """
+    Parse a single AND clause (may contain multiple AND terms with NOT modifiers).
+
+    Args:
+        clause: String like "tag:desk AND tag:candle" or "tag:hero AND NOT tag:small"
+
+    Returns:
+        tuple: (required_tags, excluded_tags) frozensets, or None if any
+        term is malformed
+    """
+    required = set()
+    excluded = set()
+
+    # Split by AND (higher precedence)
+    for term in clause.split(' AND '):
+        term = term.strip()
+
+        # Check for NOT modifier
+        if term.startswith('NOT '):
+            # NOT tag:xxx - tag must NOT be present
+            tag_match = _NOT_TAG_RE.match(term)
+            target = excluded
+        else:
+            # tag:xxx - tag must be present
+            tag_match = _TAG_RE.match(term)
+            target = required
+
+        if not tag_match:
+            # Invalid syntax, fail safe
+            return None
+        target.add(tag_match.group(1))
+
+    return (frozenset(required), frozenset(excluded))
 
 
 def validate_query(query_string):
     """
     Validate query syntax.
 
+    Results are cached by the stripped query string, so re-applying an
+    unchanged query doesn't re-run the checks.
+
     Args:
         query_string: Query string to validate
 
     Returns:
         tuple: (is_valid, error_message)
     """
-    if not query_string.strip():
+    return _validate_query_cached(query_string.strip())
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_query_cached(query_string):
+    """Validate a stripped query string (see validate_query)."""
+    if not query_string:
         return (False, "Query cannot be empty")
 
     # Check for at least one tag: clause
@@ -57,21 +133,18 @@ def validate_query(query_string):
         return (False, "Query must contain at least one 'tag:' clause")
 
     # Check for valid tag names (alphanumeric, underscore, hyphen)
-    tag_pattern = r'tag:([a-zA-Z0-9_-]+)'
-    matches = re.findall(tag_pattern, query_string)
-
-    if not matches:
+    if not _TAG_RE.search(query_string):
         return (False, "No valid tag names found (use alphanumeric, underscore, or hyphen)")
 
     # Check for orphaned operators
-    if query_string.strip().startswith(('AND ', 'OR ')):
+    if query_string.startswith(('AND ', 'OR ')):
         return (False, "Query cannot start with AND or OR")
 
-    if query_string.strip().endswith((' AND', ' OR', ' NOT')):
+    if query_string.endswith((' AND', ' OR', ' NOT')):
         return (False, "Query cannot end with an operator")
 
     # Check for NOT without following tag
-    if re.search(r'NOT\s*$', query_string):
+    if _TRAILING_NOT_RE.search(query_string):
         return (False, "NOT operator must be followed by a tag")
 
     return (True, "")
@@ -100,80 +173,38 @@ def evaluate_query(query_string, obj):
     Returns:
         bool: True if object matches query
     """
-    if not query_string.strip():
+    clauses = parse_cached(query_string)
+    if not clauses:
         return False
 
-    obj_tags = set(utils.get_tags_on_object(obj))
-
-    # Split by OR (lowest precedence)
-    # If any OR clause is true, the whole query is true
-    or_clauses = query_string.split(' OR ')
-
-    for or_clause in or_clauses:
-        if _evaluate_and_clause(or_clause.strip(), obj_tags):
-            return True
-
-    return False
+    return _matches_clauses(clauses, utils.get_tag_set_on_object(obj))
 
 
-def _evaluate_and_clause(clause, obj_tags):
+def _matches_clauses(clauses, obj_tags):
     """
-    Evaluate a single AND clause (may contain multiple AND terms with NOT modifiers).
+    Check a tag set against parsed OR clauses.
 
     Args:
-        clause: String like "tag:desk AND tag:candle" or "tag:hero AND NOT tag:small"
+        clauses: Parsed query (see parse_query)
         obj_tags: Set of tags on the object
 
     Returns:
-        bool: True if all AND terms in the clause are satisfied
+        bool: True if any OR clause is satisfied
     """
-    # Split by AND (higher precedence)
-    and_terms = clause.split(' AND ')
-
-    # All AND terms must be true
-    for term in and_terms:
-        if not _evaluate_term(term.strip(), obj_tags):
-            return False
-
-    return True
-
-
-def _evaluate_term(term, obj_tags):
-    """
-    Evaluate a single term (tag:xxx or NOT tag:xxx).
-
-    Args:
-        term: String like "tag:candle" or "NOT tag:small"
-        obj_tags: Set of tags on the object
+    for required, excluded in clauses:
+        if required <= obj_tags and excluded.isdisjoint(obj_tags):
+            return True
 
-    Returns:
-        bool: True if the term is satisfied
-    """
-    term = term.strip()
-
-    # Check for NOT modifier
-    if term.startswith('NOT '):
-        # NOT tag:xxx - tag must NOT be present
-        tag_match = re.match(r'NOT\s+tag:([a-zA-Z0-9_-]+)', term)
-        if tag_match:
-            tag = tag_match.group(1)
-            return tag not in obj_tags
-        # Invalid syntax, fail safe
-        return False
-    else:
-        # tag:xxx - tag must be present
-        tag_match = re.match(r'tag:([a-zA-Z0-9_-]+)', term)
-        if tag_match:
-            tag = tag_match.group(1)
-            return tag in obj_tags
-        # Invalid syntax, fail safe
-        return False
+    return False
 
 
 def get_objects_matching_query(query_string, scene):
     """
     Get all objects in scene that match the query.
 
+    Results are cached until tags are marked dirty, so re-evaluating a
+    query (e.g. from several Views or redraws) skips the scene scan.
+
     Args:
         query_string: Query string to evaluate
         scene: Blender scene
@@ -181,10 +212,63 @@ def get_objects_matching_query(query_string, scene):
     Returns:
         list: List of matching objects
     """
-    matching = []
+    return list(_matching_objects_cached(scene, query_string, utils.get_tag_revision()))
 
-    for obj in scene.objects:
-        if evaluate_query(query_string, obj):
-            matching.append(obj)
 
-    return matching
+@functools.lru_cache(maxsize=32)
+def _matching_objects_cached(scene, query_string, revision):
+    """
+    Memoized query results for one tag revision.
+
+    The revision is part of the key, so a tag change simply stops hitting
+    the old entries and they age out of the LRU; only the most recently
+    used queries are kept.
+    """
+    return tuple(_find_matching_objects(query_string, scene))
+
+
+def _find_matching_objects(query_string, scene):
+    """Scan the scene for objects matching a query (uncached)."""
+    # Parse once; the per-object check is then pure set algebra
+    clauses = parse_cached(query_string)
+    if not clauses:
+        return []
+
+    # Fast path for the common single-tag query: read its index bucket
+    if len(clauses) == 1:
+        required, excluded = clauses[0]
+        if len(required) == 1 and not excluded:
+            (tag,) = required
+            bucket = utils.get_tag_index(scene).get(tag, ())
+            return sorted(bucket, key=utils.get_object_positions(scene).__getitem__)
+
+    # When every clause requires a tag, answer from the tag index instead
+    # of testing each object: intersect a clause's buckets (giving up on
+    # the clause at the first tag nobody carries), drop excluded objects,
+    # and union the clauses. Results keep scene order.
+    if all(required for required, _ in clauses):
+        index = utils.get_tag_index(scene)
+        matched = set()
+        for required, excluded in clauses:
+            buckets = []
+            for tag in required:
+                bucket = index.get(tag)
+                if bucket is None:
+                    break
+                buckets.append(bucket)
+            else:
+                buckets.sort(key=len)
+                candidates = buckets[0].intersection(*buckets[1:])
+                for tag in excluded:
+                    candidates -= index.get(tag, ())
+                matched |= candidates
+
+        positions = utils.get_object_positions(scene)
+        return sorted(matched, key=positions.__getitem__)
+
+    # NOT-only clauses match untagged objects too, so scan every object.
+    # Tag sets come from the tag index, so no object's tags are decoded here
+    return [
+        obj for obj, obj_tags in utils.get_object_tag_sets(scene)
+        if _matches_clauses(clauses, obj_tags)
+    ]
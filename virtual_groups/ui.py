@@ -123,6 +123,12 @@ class VG_PT_tags_subpanel(Panel):
         layout = self.layout
         scene = context.scene
         props = scene.vg_props
+
+        # Selection state, read once per draw and reused by every section
+        num_selected = utils.get_viewport_selection_count(context)
+        has_viewport_selection = num_selected > 0
+        selected_tags = utils.get_selected_tag_set(props)  # O(1) lookups per pill
+        has_tag_selection = bool(selected_tags)
         
         # Search bar (placeholder for v1)
         row = layout.row()
@@ -139,8 +145,7 @@ class VG_PT_tags_subpanel(Panel):
         
         # Viewport Selection Indicator
         box = layout.box()
-        num_selected = len(context.selected_objects)
-        if num_selected > 0:
+        if has_viewport_selection:
             box.label(text=f"🎯 {num_selected} objects selected in viewport", icon='NONE')
         else:
             box.label(text="🎯 No objects selected in viewport", icon='NONE')
@@ -148,33 +153,51 @@ class VG_PT_tags_subpanel(Panel):
         # Separator
         layout.separator()
         
-        # Scene Tags section (Tag Palette)
-        layout.label(text="Scene Tags", icon='BOOKMARKS')
-
-        # Get all scene tags and filter out view-* tags (internal membership tags)
-        all_tags = utils.get_all_scene_tags(scene)
-        display_tags = [tag for tag in all_tags if not tag.startswith('view-')]
-
-        if display_tags:
-            # Get selected tags for highlighting
-            selected_tags_str = props.selected_tags
-            selected_tags = selected_tags_str.split(',') if selected_tags_str else []
-
-            # Grid layout for tag pills (toggle buttons)
-            flow = layout.grid_flow(row_major=True, columns=3, align=True)
-            for tag in display_tags:
-                # Create toggle button that appears pressed when selected
-                is_selected = tag in selected_tags
-                op = flow.operator(
-                    "virtual_groups.toggle_tag_selection",
-                    text=tag,
-                    depress=is_selected,
-                    emboss=True
-                )
-                op.tag_name = tag
-        else:
-            # No tags in scene yet
-            layout.label(text="No tags in scene", icon='INFO')
+        # Scene Tags section (Tag Palette), collapsible: when collapsed the
+        # tag list isn't fetched and no pills are built
+        icon = 'TRIA_DOWN' if props.show_scene_tags else 'TRIA_RIGHT'
+        row = layout.row()
+        row.alignment = 'LEFT'
+        row.prop(props, "show_scene_tags", text="Scene Tags", icon=icon, emboss=False)
+
+        if props.show_scene_tags:
+            # Scene tags without view-* tags (internal membership tags)
+            display_tags = utils.get_display_tags(scene)
+
+            if display_tags:
+                # Only one page of pills is drawn, so per-draw work stays bounded
+                # however many tags the scene has (page clamped if tags were removed)
+                page_size = props.tag_palette_page_size
+                num_pages = (len(display_tags) + page_size - 1) // page_size
+                page = min(props.tag_palette_page, num_pages - 1)
+                page_tags = display_tags[page * page_size:(page + 1) * page_size]
+
+                # Grid layout for tag pills (toggle buttons)
+                flow = layout.grid_flow(row_major=True, columns=3, align=True)
+                for tag in page_tags:
+                    # Create toggle button that appears pressed when selected
+                    is_selected = tag in selected_tags
+                    op = flow.operator(
+                        "virtual_groups.toggle_tag_selection",
+                        text=tag,
+                        depress=is_selected,
+                        emboss=True
+                    )
+                    op.tag_name = tag
+
+                # Page navigation (only when the tags don't fit on one page)
+                if num_pages > 1:
+                    row = layout.row(align=True)
+                    sub = row.row(align=True)
+                    sub.enabled = page > 0
+                    sub.operator("virtual_groups.tag_palette_page", text="", icon='TRIA_LEFT').delta = -1
+                    row.label(text=f"Page {page + 1} / {num_pages}")
+                    sub = row.row(align=True)
+                    sub.enabled = page < num_pages - 1
+                    sub.operator("virtual_groups.tag_palette_page", text="", icon='TRIA_RIGHT').delta = 1
+            else:
+                # No tags in scene yet
+                layout.label(text="No tags in scene", icon='INFO')
 
         # Separator
         layout.separator()
@@ -183,44 +206,34 @@ class VG_PT_tags_subpanel(Panel):
         box = layout.box()
         col = box.column(align=False)
 
-        # Check context for enabling/disabling buttons
-        has_tag_selection = bool(props.selected_tags)
-        has_viewport_selection = num_selected > 0
+        # Each section's buttons share one sub-column, so the "needs a tag
+        # selection" state is set once per section instead of per button
 
         # Tag Operations section (only when viewport has selection)
         if has_viewport_selection:
             col.label(text="Tag Operations", icon='MODIFIER')
-            row = col.row(align=True)
-            row.operator("virtual_groups.tag_palette_add_tags", text="Add Tags")
-            row.enabled = has_tag_selection
-
-            row = col.row(align=True)
-            row.operator("virtual_groups.tag_palette_remove_tags", text="Remove Tags")
-            row.enabled = has_tag_selection
+            sub = col.column(align=True)
+            sub.enabled = has_tag_selection
+            sub.operator("virtual_groups.tag_palette_add_tags", text="Add Tags")
+            sub.operator("virtual_groups.tag_palette_remove_tags", text="Remove Tags")
 
             col.separator()
 
         # Visibility Operations section (always shown)
         col.label(text="Visibility", icon='HIDE_OFF')
-        row = col.row(align=True)
-        row.operator("virtual_groups.tag_palette_hide", text="Hide")
-        row.enabled = has_tag_selection
-
-        row = col.row(align=True)
-        row.operator("virtual_groups.tag_palette_show", text="Show")
-        row.enabled = has_tag_selection
-
-        row = col.row(align=True)
-        row.operator("virtual_groups.tag_palette_toggle", text="Toggle")
-        row.enabled = has_tag_selection
+        sub = col.column(align=True)
+        sub.enabled = has_tag_selection
+        sub.operator("virtual_groups.tag_palette_hide", text="Hide")
+        sub.operator("virtual_groups.tag_palette_show", text="Show")
+        sub.operator("virtual_groups.tag_palette_toggle", text="Toggle")
 
         col.separator()
 
         # Selection Operations section (always shown)
         col.label(text="Selection", icon='RESTRICT_SELECT_OFF')
-        row = col.row(align=True)
-        row.operator("virtual_groups.tag_palette_select", text="Select")
-        row.enabled = has_tag_selection
+        sub = col.column(align=True)
+        sub.enabled = has_tag_selection
+        sub.operator("virtual_groups.tag_palette_select", text="Select")
 
         # Separator
         layout.separator()
@@ -228,28 +241,34 @@ class VG_PT_tags_subpanel(Panel):
         # Selected Objects section (collapsible)
         box = layout.box()
         
-        # Header row with collapse icon
+        # Header row with collapse icon (down if expanded, right if collapsed)
+        icon = 'TRIA_DOWN' if props.show_selected_tags else 'TRIA_RIGHT'
         row = box.row()
-        row.label(text=f"Selected Objects ({num_selected})", icon='OBJECT_DATA')
+        row.alignment = 'LEFT'
+        row.prop(
+            props,
+            "show_selected_tags",
+            text=f"Selected Objects ({num_selected})",
+            icon=icon,
+            emboss=False
+        )
         
-        # Only show content if objects are selected
-        if num_selected > 0:
+        # Only show content if expanded and objects are selected (collapsed
+        # skips the tag union over the selection entirely)
+        if props.show_selected_tags and has_viewport_selection:
             box.label(text="Tags on selected objects", icon='INFO')
             
-            # Get tags from selected objects (union of all tags)
-            selected_obj_tags = set()
-            for obj in context.selected_objects:
-                obj_tags = utils.get_tags_on_object(obj)
-                selected_obj_tags.update(obj_tags)
-
-            # Filter out view-* tags (internal membership tags)
-            display_selected_tags = {tag for tag in selected_obj_tags if not tag.startswith('view-')}
+            # Sorted tags on the selected objects, without view-* tags
+            # (cached per distinct combination of tag sets)
+            display_selected_tags = utils.get_display_tags_on_objects(
+                context.selected_objects
+            )
 
             if display_selected_tags:
                 # Show tags as removable pills
                 # Using a column of rows instead of grid_flow for better compatibility
                 col = box.column(align=True)
-                for tag in sorted(display_selected_tags):
+                for tag in display_selected_tags:
                     row = col.row(align=True)
                     row.label(text=tag, icon='BOOKMARKS')
                     op = row.operator(
@@ -283,12 +302,9 @@ class VG_UL_views(UIList):
     
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         """Draw a single View item in the list."""
-        # Access view directly from scene collection using index for reliability
-        scene = context.scene
-        if index < 0 or index >= len(scene.vg_views):
-            return
-
-        view = scene.vg_views[index]
+        # Blender passes the row's View as item; the index is still the
+        # View's position in scene.vg_views (also when filtered or sorted)
+        view = item
 
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
             # Create a row for the entire item
@@ -354,18 +370,19 @@ classes = (
     VG_UL_views,
 )
 
+# Builds register/unregister callables for the tuple (unregister runs in reverse)
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 
 def register():
     """Register all UI classes."""
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     
     print("Virtual Groups UI registered")
 
 
 def unregister():
     """Unregister all UI classes."""
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
     
     print("Virtual Groups UI unregistered")
@@ -3,19 +3,100 @@ Utilities module for Virtual Groups
 
 Helper functions for:
 - Tag manipulation on objects
+- Tag index (tag -> objects) for fast lookups
 - Object filtering and querying
 - Scene tag enumeration
 - Validation
 """
 
+import functools
 import json
 import re
 
+# Characters allowed in a tag name (shared with the query parser's patterns)
+TAG_NAME_PATTERN = r'[a-zA-Z0-9_-]+'
+
+# Compiled once; \Z (unlike $) rejects a trailing newline
+_TAG_NAME_RE = re.compile(TAG_NAME_PATTERN + r'\Z')
+
+# Tags are stored as one comma-joined string (e.g. "candle,desk"); valid tag
+# names never contain commas. Older files stored a JSON list instead.
+_TAG_SEPARATOR = ","
+
 
 # ============================================================================
 # Tag Management (Phase 2)
 # ============================================================================
 
+@functools.lru_cache(maxsize=4096)
+def _parse_tags(raw):
+    """
+    Decode a raw vg_tags property value.
+
+    Cached by the raw string, so objects sharing the same tags (and
+    repeated scans over unchanged objects) only decode it once. Legacy
+    JSON lists are still read; they are rewritten in the delimited form
+    the next time the object's tags change.
+
+    Args:
+        raw: String stored in the vg_tags property
+
+    Returns:
+        tuple: Tag strings (empty if the value is corrupted)
+    """
+    if raw.startswith("["):
+        try:
+            tags = json.loads(raw)
+        except ValueError:
+            return ()
+        # Legacy names are kept even if they no longer validate
+        if not isinstance(tags, list):
+            return ()
+        return tuple(tag for tag in tags if isinstance(tag, str))
+
+    # Drop anything that isn't a valid tag (hand edits, stray separators)
+    return tuple(tag for tag in raw.split(_TAG_SEPARATOR) if _TAG_NAME_RE.match(tag))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_tag_set(raw):
+    """Decode a raw vg_tags property value into a frozenset (cached)."""
+    return frozenset(_parse_tags(raw))
+
+
+def get_tag_set_on_object(obj):
+    """
+    Get an object's tags as a set, for membership tests.
+
+    Args:
+        obj: Blender object
+
+    Returns:
+        frozenset: Tag strings (cached and shared between objects)
+    """
+    return _parse_tag_set(obj.get("vg_tags", ""))
+
+
+def object_has_tag(obj, tag):
+    """
+    Check whether an object carries a tag, without decoding its tags.
+
+    A tag can only be stored if its name appears in the raw string. That
+    C-level substring scan rejects most objects; hits are confirmed
+    against the cached set (the name may be part of a longer tag).
+    Legacy JSON values may escape names, so they always use the set.
+
+    Args:
+        obj: Blender object
+        tag: Tag string to look for
+
+    Returns:
+        bool: True if the object has the tag
+    """
+    raw = obj.get("vg_tags", "")
+    return (tag in raw or raw.startswith("[")) and tag in _parse_tag_set(raw)
+
+
 def get_tags_on_object(obj):
     """
     Get list of tags from an object.
@@ -24,24 +105,45 @@ def get_tags_on_object(obj):
         obj: Blender object
         
     Returns:
-        list: List of tag strings
+        list: List of tag strings (a fresh list the caller may modify)
     """
-    tags_json = obj.get("vg_tags", "[]")
-    try:
-        return json.loads(tags_json)
-    except json.JSONDecodeError:
-        return []
+    return list(_parse_tags(obj.get("vg_tags", "")))
 
 
 def set_tags_on_object(obj, tags):
     """
     Set tags on an object.
+
+    Tags are stored comma-joined. A name that form can't hold (only ones
+    carried over from a legacy JSON value; new names are validated by
+    the callers that add them) keeps the whole value in JSON, so it is
+    never lost.
     
     Args:
         obj: Blender object
         tags: List of tag strings
     """
-    obj["vg_tags"] = json.dumps(tags)
+    if all(_TAG_NAME_RE.match(tag) for tag in tags):
+        obj["vg_tags"] = _TAG_SEPARATOR.join(tags)
+    else:
+        obj["vg_tags"] = json.dumps(tags)
+    _update_tag_index(obj)
+
+
+def _check_new_tags(tags):
+    """
+    Raise ValueError for the first invalid name among tags being added.
+
+    Args:
+        tags: Iterable of tag strings
+
+    Raises:
+        ValueError: With validate_tag_name's message
+    """
+    for tag in tags:
+        is_valid, error = validate_tag_name(tag)
+        if not is_valid:
+            raise ValueError(f"Invalid tag '{tag}': {error}")
 
 
 def add_tag_to_object(obj, tag):
@@ -51,11 +153,13 @@ def add_tag_to_object(obj, tag):
     Args:
         obj: Blender object
         tag: Tag string to add
+
+    Raises:
+        ValueError: If tag is not a valid tag name
     """
-    tags = get_tags_on_object(obj)
-    if tag not in tags:
-        tags.append(tag)
-        set_tags_on_object(obj, tags)
+    _check_new_tags([tag])
+    if tag not in get_tag_set_on_object(obj):
+        set_tags_on_object(obj, get_tags_on_object(obj) + [tag])
 
 
 def remove_tag_from_object(obj, tag):
@@ -66,12 +170,75 @@ def remove_tag_from_object(obj, tag):
         obj: Blender object
         tag: Tag string to remove
     """
+    if not object_has_tag(obj, tag):
+        return
+
     tags = get_tags_on_object(obj)
     if tag in tags:
         tags.remove(tag)
         set_tags_on_object(obj, tags)
 
 
+def batch_modify_tags(objects, add=(), remove=()):
+    """
+    Add and remove tags on several objects, writing each at most once.
+
+    Each object ends up with (tags | add) - remove; existing tags keep
+    their order and new ones are appended. Objects already in that state
+    are skipped without decoding or rewriting their tag property.
+
+    Args:
+        objects: Iterable of Blender objects
+        add: Iterable of tag strings to add
+        remove: Iterable of tag strings to remove (wins over add)
+
+    Raises:
+        ValueError: If a tag to add is not a valid tag name; raised before
+            any object is written
+    """
+    remove = frozenset(remove)
+    add = [tag for tag in dict.fromkeys(add) if tag not in remove]
+    _check_new_tags(add)
+    wanted = frozenset(add)
+
+    for obj in objects:
+        current = get_tag_set_on_object(obj)
+        if wanted <= current and remove.isdisjoint(current):
+            continue
+
+        tags = [tag for tag in get_tags_on_object(obj) if tag not in remove]
+        tags += [tag for tag in add if tag not in current]
+        set_tags_on_object(obj, tags)
+
+
+def add_tags_to_objects(objects, tags):
+    """
+    Add several tags to each of several objects.
+
+    Objects that already carry every tag are skipped without decoding
+    or rewriting their tag property.
+
+    Args:
+        objects: Iterable of Blender objects
+        tags: Iterable of tag strings to add
+    """
+    batch_modify_tags(objects, add=tags)
+
+
+def remove_tags_from_objects(objects, tags):
+    """
+    Remove several tags from each of several objects.
+
+    Objects carrying none of the tags are skipped without decoding or
+    rewriting their tag property.
+
+    Args:
+        objects: Iterable of Blender objects
+        tags: Iterable of tag strings to remove
+    """
+    batch_modify_tags(objects, remove=tags)
+
+
 def validate_tag_name(tag):
     """
     Validate a tag name.
@@ -87,7 +254,7 @@ def validate_tag_name(tag):
     if not tag:
         return (False, "Tag name cannot be empty")
     
-    if not re.match(r'^[a-zA-Z0-9_-]+$', tag):
+    if _TAG_NAME_RE.match(tag) is None:
         return (False, "Tag name can only contain letters, numbers, underscores, and hyphens")
     
     return (True, "")
@@ -96,18 +263,274 @@ def validate_tag_name(tag):
 def get_all_scene_tags(scene):
     """
     Get all unique tags used in the scene.
-    
+
+    Sorted once per tag revision: the panel asks on every redraw.
+
     Args:
         scene: Blender scene
-        
+
     Returns:
-        list: Sorted list of unique tag strings
+        list: Sorted list of unique tag strings (shared; do not modify)
     """
-    all_tags = set()
-    for obj in scene.objects:
-        tags = get_tags_on_object(obj)
-        all_tags.update(tags)
-    return sorted(all_tags)
+    cache = _refresh_tag_index(scene)
+    if cache["sorted_tags"] is None:
+        # The tag index's keys are exactly the tags in use
+        cache["sorted_tags"] = sorted(cache["tags"])
+    return cache["sorted_tags"]
+
+
+def get_display_tags(scene):
+    """
+    Get the scene's user-facing tags, without View membership tags.
+
+    Filtered once per tag revision alongside the sorted tag list, so the
+    Tag Palette doesn't re-check every tag for the view- prefix per draw.
+
+    Args:
+        scene: Blender scene
+
+    Returns:
+        list: Sorted tag strings, excluding view-* tags (shared; do not modify)
+    """
+    cache = _refresh_tag_index(scene)
+    if cache["display_tags"] is None:
+        cache["display_tags"] = [
+            tag for tag in get_all_scene_tags(scene) if not tag.startswith("view-")
+        ]
+    return cache["display_tags"]
+
+
+@functools.lru_cache(maxsize=64)
+def _display_tag_union(tag_sets):
+    """Sorted union of tag sets without view-* tags (cached by the sets)."""
+    return tuple(sorted(
+        tag for tag in frozenset().union(*tag_sets) if not tag.startswith("view-")
+    ))
+
+
+def get_display_tags_on_objects(objects):
+    """
+    Get the user-facing tags carried by any of the given objects.
+
+    Objects with identical tags share one cached tag set, so the key is
+    just the distinct sets; redrawing an unchanged selection reuses the
+    sorted result instead of filtering and sorting again.
+
+    Args:
+        objects: Iterable of Blender objects (e.g. the viewport selection)
+
+    Returns:
+        tuple: Sorted tag strings, excluding view-* tags
+    """
+    return _display_tag_union(frozenset(map(get_tag_set_on_object, objects)))
+
+
+# ============================================================================
+# Tag Index
+# ============================================================================
+
+# Bumped whenever tags may have changed; cached lookups compare against it
+_tag_revision = 0
+
+# Inverted index (tag -> set of objects), object -> tag set (in scene
+# order), and the sorted tag lists and object positions (built on first use)
+# for the most recently used scene
+_tag_index = {
+    "scene": None, "revision": -1, "tags": {}, "objects": {},
+    "sorted_tags": None, "display_tags": None, "positions": None,
+}
+
+
+def mark_tags_dirty():
+    """
+    Invalidate cached tag lookups.
+
+    Called by the add-on's handlers whenever Blender may have changed tags
+    or objects behind our back (undo, file load, collection changes). The
+    tag index is rebuilt on next use.
+    """
+    global _tag_revision
+    _tag_revision += 1
+
+
+def sync_object_tags(scene, objects):
+    """
+    Bring the tag index up to date with objects Blender reports as updated.
+
+    Called from the depsgraph handler instead of mark_tags_dirty, so the
+    many updates that don't touch tags (transforms, edits, playback, and
+    our own tag writes, already applied) keep the index and every
+    per-revision cache. Objects whose tags did change are patched in
+    place; an object the index doesn't know means objects were added, and
+    a changed object count means some were removed, so those fall back
+    to a full rebuild. Objects can be linked into several scenes, so an
+    update from a scene other than the indexed one also invalidates.
+
+    Args:
+        scene: Blender scene the update belongs to
+        objects: Updated (original, not evaluated) objects; may be empty
+            to only re-check the object count
+    """
+    cache = _tag_index
+    if cache["revision"] != _tag_revision:
+        # Already stale; rebuilt on next use anyway
+        return
+    if cache["scene"] != scene:
+        mark_tags_dirty()
+        return
+
+    indexed = cache["objects"]
+    if len(indexed) != len(scene.objects):
+        mark_tags_dirty()
+        return
+
+    for obj in objects:
+        old_tags = indexed.get(obj)
+        if old_tags is None:
+            mark_tags_dirty()
+            return
+        if get_tag_set_on_object(obj) != old_tags:
+            _update_tag_index(obj)
+
+
+def _update_tag_index(obj):
+    """
+    Bump the tag revision after a tag write, patching the index in place.
+
+    Rather than forcing a full rebuild, the object is moved from the
+    buckets the index recorded for it to those of its current tags. The
+    recorded set is used (not the property's value before the write), so
+    direct property edits the index never saw are corrected too. If the
+    index is already stale or doesn't cover the object, it is left to
+    rebuild lazily.
+
+    Args:
+        obj: Blender object whose vg_tags property was just written
+    """
+    global _tag_revision
+    cache = _tag_index
+    objects = cache["objects"]
+    old_tags = objects.get(obj)
+    in_sync = cache["revision"] == _tag_revision and old_tags is not None
+    _tag_revision += 1
+    if not in_sync:
+        return
+
+    new_tags = get_tag_set_on_object(obj)
+    index = cache["tags"]
+    for tag in old_tags - new_tags:
+        bucket = index.get(tag)
+        if bucket is None:
+            continue
+        bucket.discard(obj)
+        if not bucket:
+            del index[tag]
+            cache["sorted_tags"] = cache["display_tags"] = None
+    for tag in new_tags - old_tags:
+        bucket = index.get(tag)
+        if bucket is None:
+            index[tag] = {obj}
+            cache["sorted_tags"] = cache["display_tags"] = None
+        else:
+            bucket.add(obj)
+
+    objects[obj] = new_tags
+    cache["revision"] = _tag_revision
+
+
+def _refresh_tag_index(scene):
+    """Rebuild the cached tag index if tags changed or the scene differs."""
+    cache = _tag_index
+    if cache["revision"] != _tag_revision or cache["scene"] != scene:
+        index = {}
+        objects = {}
+        for obj in scene.objects:
+            tags = get_tag_set_on_object(obj)
+            objects[obj] = tags
+            for tag in tags:
+                index.setdefault(tag, set()).add(obj)
+        cache["scene"] = scene
+        cache["revision"] = _tag_revision
+        cache["tags"] = index
+        cache["objects"] = objects
+        cache["sorted_tags"] = cache["display_tags"] = None
+        cache["positions"] = None
+    return cache
+
+
+def get_tag_revision():
+    """
+    Get the current tag revision.
+
+    Caches of tag-derived results can store this and compare it later;
+    any change means tags may have changed since.
+
+    Returns:
+        int: Revision counter, bumped by mark_tags_dirty
+    """
+    return _tag_revision
+
+
+def get_tag_index(scene):
+    """
+    Get the inverted tag index for a scene.
+
+    The index is built with a single pass over scene.objects, then kept
+    up to date by tag writes until tags are marked dirty or a different
+    scene is queried.
+
+    Args:
+        scene: Blender scene
+
+    Returns:
+        dict: Tag string -> set of objects carrying that tag (shared and
+        updated in place; copy a bucket before writing tags while
+        iterating it)
+    """
+    return _refresh_tag_index(scene)["tags"]
+
+
+def get_object_tag_sets(scene):
+    """
+    Get every scene object paired with its tag set.
+
+    Built in the same pass (and kept up to date the same way) as the tag
+    index, so scans over all objects don't decode any tags.
+
+    Args:
+        scene: Blender scene
+
+    Returns:
+        Iterable of (object, frozenset of tags) pairs in scene order
+    """
+    return _refresh_tag_index(scene)["objects"].items()
+
+
+def get_object_positions(scene, verify=False):
+    """
+    Map every scene object to its position in scene.objects.
+
+    Lets bulk per-object arrays (e.g. filled by foreach_get) be indexed
+    by object. Built from the tag index once per full rebuild; tag writes
+    never add or reorder objects.
+
+    Args:
+        scene: Blender scene
+        verify: Check the positions against scene.objects first, and
+            rebuild the index once if they disagree (objects added,
+            removed or reordered without the index being told). Costs a
+            pass over the scene, so only bulk readers should ask.
+
+    Returns:
+        dict: Object -> index into scene.objects (shared; do not modify)
+    """
+    cache = _refresh_tag_index(scene)
+    if verify and list(cache["objects"]) != list(scene.objects):
+        mark_tags_dirty()
+        cache = _refresh_tag_index(scene)
+    if cache["positions"] is None:
+        cache["positions"] = {obj: i for i, obj in enumerate(cache["objects"])}
+    return cache["positions"]
 
 
 # ============================================================================
@@ -124,28 +547,44 @@ def get_objects_with_tags(scene, tags, mode='OR'):
         mode: 'OR' (any tag) or 'AND' (all tags)
 
     Returns:
-        list: List of matching objects
+        list: List of matching objects, in scene order
     """
-    matching = []
-    tag_set = set(tags)
+    tag_set = frozenset(tags)
 
     # Empty tag list should return no objects
     if not tag_set:
         return []
 
-    for obj in scene.objects:
-        obj_tags = set(get_tags_on_object(obj))
+    index = get_tag_index(scene)
 
-        if mode == 'OR':
-            # Object has ANY of the tags
-            if obj_tags & tag_set:
-                matching.append(obj)
-        elif mode == 'AND':
-            # Object has ALL of the tags
-            if tag_set.issubset(obj_tags):
-                matching.append(obj)
+    # No tagged objects at all (common in fresh scenes)
+    if not index:
+        return []
+
+    buckets = [index.get(tag) for tag in tag_set]
+
+    if mode == 'OR':
+        # Object has ANY of the tags: union of the tag buckets that exist
+        buckets = [bucket for bucket in buckets if bucket]
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            # Single bucket: no union set to build
+            matched = buckets[0]
+        else:
+            matched = buckets[0].union(*buckets[1:])
+    elif mode == 'AND':
+        # A tag nobody carries means no object can have all of them
+        if None in buckets:
+            return []
+        # Object has ALL of the tags: intersect, smallest bucket first
+        buckets.sort(key=len)
+        matched = buckets[0].intersection(*buckets[1:])
+    else:
+        return []
 
-    return matching
+    # Buckets are sets; keep the scene order callers saw from a scan
+    return sorted(matched, key=get_object_positions(scene).__getitem__)
 
 
 # ============================================================================
@@ -162,6 +601,8 @@ def has_viewport_selection(context):
     Returns:
         bool: True if objects are selected
     """
+    # Same source as the operators and the Selected Objects panel, so
+    # polls never disagree with what they act on
     return len(context.selected_objects) > 0
 
 
@@ -178,10 +619,50 @@ def get_viewport_selection_count(context):
     return len(context.selected_objects)
 
 
+# ============================================================================
+# Tag Palette Selection
+# ============================================================================
+
+def get_selected_tag_set(props):
+    """
+    Get the tags currently selected in the Tag Palette.
+
+    Args:
+        props: Scene vg_props property group
+
+    Returns:
+        frozenset: Selected tag strings
+    """
+    return frozenset(item.name for item in props.selected_tags)
+
+
+def toggle_selected_tag(props, tag):
+    """
+    Select a tag in the Tag Palette, or deselect it if already selected.
+
+    Adds or removes the one collection item instead of rewriting the
+    whole selection.
+
+    Args:
+        props: Scene vg_props property group
+        tag: Tag string to toggle
+    """
+    selected = props.selected_tags
+    index = selected.find(tag)
+    if index >= 0:
+        selected.remove(index)
+    else:
+        selected.add().name = tag
+
+
 # ============================================================================
 # View Object Resolution (v1 - Hybrid Model)
 # ============================================================================
 
+# Resolved View contents keyed by (scene, GUID, query), for one tag revision
+_view_cache = {"revision": -1, "views": {}}
+
+
 def get_objects_in_view(view, scene):
     """
     Get all objects that belong to a View (hybrid model).
@@ -195,13 +676,30 @@ def get_objects_in_view(view, scene):
     - Pure membership (explicit): no query, manual additions
     - Hybrid (best of both): query + manual exceptions/additions
 
+    Results are cached per (scene, GUID, query) until tags are marked
+    dirty, so operators and redraws resolving the same View reuse them.
+
     Args:
         view: VG_ViewProperty instance
         scene: Blender scene
 
     Returns:
-        list: List of objects in this View
+        list: List of objects in this View (shared; do not modify)
     """
+    cache = _view_cache
+    if cache["revision"] != _tag_revision:
+        cache["revision"] = _tag_revision
+        cache["views"] = {}
+
+    key = (scene, view.guid, view.query)
+    objects = cache["views"].get(key)
+    if objects is None:
+        objects = cache["views"][key] = _resolve_view_objects(view, scene)
+    return objects
+
+
+def _resolve_view_objects(view, scene):
+    """Evaluate a View's query and membership (see get_objects_in_view)."""
     # Import query_parser (handle both package and direct import)
     try:
         from . import query_parser
@@ -210,15 +708,88 @@ def get_objects_in_view(view, scene):
 
     matched_objects = set()
 
-    # 1. Query-based inclusion (if query exists)
-    if view.query.strip():
+    # 1. Query-based inclusion (if the query has any clause that can match)
+    if query_parser.parse_cached(view.query):
         query_matches = query_parser.get_objects_matching_query(view.query, scene)
         matched_objects.update(query_matches)
 
-    # 2. Membership-based inclusion (via special tag)
-    membership_tag = f"view-{view.guid}"
-    for obj in scene.objects:
-        if membership_tag in get_tags_on_object(obj):
-            matched_objects.add(obj)
+    # 2. Membership-based inclusion (via special tag): one index lookup
+    # instead of checking every scene object
+    members = get_tag_index(scene).get(f"view-{view.guid}")
+    if members:
+        matched_objects.update(members)
 
     return list(matched_objects)
+
+
+def update_view_icon_states(view, scene, objects=None):
+    """
+    Update cached icon states for a view based on current object visibility.
+
+    Pass the View's objects if the caller already resolved them. Only
+    states that changed are written, so refreshing from a depsgraph
+    handler doesn't trigger further updates.
+
+    Args:
+        view: VG_ViewProperty instance
+        scene: Blender scene
+        objects: The View's objects (resolved if None)
+    """
+    if objects is None:
+        objects = get_objects_in_view(view, scene)
+
+    # Empty view defaults to "all visible"
+    set_view_icon_states(
+        view,
+        all(not obj.hide_viewport for obj in objects),
+        all(not obj.hide_render for obj in objects),
+    )
+
+
+def set_view_icon_states(view, all_visible, all_render_visible):
+    """
+    Write a View's cached icon states, skipping ones that are unchanged.
+
+    Args:
+        view: VG_ViewProperty instance
+        all_visible: Whether every object in the View is visible in viewport
+        all_render_visible: Whether every object in the View renders
+    """
+    if view.icon_all_visible != all_visible:
+        view.icon_all_visible = all_visible
+    if view.icon_all_render_visible != all_render_visible:
+        view.icon_all_render_visible = all_render_visible
+
+
+def get_objects_with_children(objects, scene):
+    """
+    Expand objects with all of their descendants in the scene.
+
+    Builds a parent -> children map in one pass over the scene, then walks
+    down from the given objects, so shared subtrees are visited once
+    (unlike calling children_recursive per object).
+
+    Args:
+        objects: Iterable of Blender objects
+        scene: Blender scene
+
+    Returns:
+        list: The objects followed by their descendants, without duplicates
+    """
+    children = {}
+    for obj in scene.objects:
+        parent = obj.parent
+        if parent is not None:
+            children.setdefault(parent, []).append(obj)
+
+    result = list(dict.fromkeys(objects))
+    seen = set(result)
+    stack = list(result)
+    while stack:
+        for child in children.get(stack.pop(), ()):
+            if child not in seen:
+                seen.add(child)
+                result.append(child)
+                stack.append(child)
+
+    return result